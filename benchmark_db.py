@@ -0,0 +1,144 @@
+"""Görev veritabanı sorgularını indekssiz (tarama) ve indeksli olarak karşılaştırır.
+
+Kullanım: python benchmark_db.py [satır sayıları...]   (varsayılan: 10000 100000 1000000)
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from todo import (CATEGORIES, DOING, DONE, HIGH, PRIORITIES, SORT_MODES, TODO, WISHLIST,
+                  TaskRepository, configure_connection, migrate_database, spread_ranks)
+
+# Gerçekçi dağılım: görevlerin çoğu "Bitti" sütununda birikir
+CATEGORY_WEIGHTS = [20, 5, 70, 5]
+
+# (açıklama, sorgu, parametreler); sayfa sorguları uygulamanın kendi sorgularıdır.
+# Son sayfa sorgularında anahtar (None) çalıştırmadan önce veritabanından bulunur.
+QUERIES = [
+    ("Sütunun ilk sayfası (Yapılıyor)",
+     TaskRepository.page_sql("manual", first=True),
+     (DOING, 50)),
+    ("Sütunun son sayfası (Dilek Listesi)",
+     TaskRepository.page_sql("manual"),
+     (WISHLIST, "manual", None, None, 50)),
+    ("Öncelik sırasıyla ilk sayfa (Bitti)",
+     TaskRepository.page_sql("priority", first=True),
+     (DONE, 50)),
+    ("Öncelik sırasıyla son sayfa (Bitti)",
+     TaskRepository.page_sql("priority"),
+     (DONE, "priority", None, None, 50)),
+    ("Bitiş tarihi sırasıyla ilk sayfa (Bitti)",
+     TaskRepository.page_sql("due", first=True),
+     (DONE, 50)),
+    ("En yeniler, ilk sayfa (Bitti)",
+     TaskRepository.page_sql("created", first=True),
+     (DONE, 50)),
+    ("Kategori/öncelik sayımları",
+     "SELECT category, priority, COUNT(*) FROM tasks "
+     "WHERE completed = 0 GROUP BY category, priority",
+     ()),
+    ("Yüksek öncelikli ve tarihi geçmiş (Yapılacak)",
+     "SELECT id FROM tasks WHERE completed = 0 AND category = ? "
+     "AND priority = ? AND due_date < ?",
+     (TODO, HIGH, "2026-03-01")),
+]
+
+def create_database(path, rows):
+    # Uygulamanın güncel şeması; sıra değerleri kategori içinde id sırasıyla dağıtılır
+    conn = configure_connection(sqlite3.connect(path))
+    migrate_database(conn)
+    rng = random.Random(42)
+    categories = rng.choices(range(len(CATEGORIES)), CATEGORY_WEIGHTS, k=rows)
+    positions = {category: iter(spread_ranks(categories.count(category)))
+                 for category in range(len(CATEGORIES))}
+    conn.executemany(
+        "INSERT INTO tasks (title, category, priority, due_date, position) VALUES (?, ?, ?, ?, ?)",
+        ((f"Görev {i}", categories[i], rng.randrange(len(PRIORITIES)),
+          f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+          next(positions[categories[i]])) for i in range(rows)))
+    conn.commit()
+    return conn
+
+def time_query(conn, sql, params, repeat=5):
+    # En iyi süreyi milisaniye olarak döndür
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def query_plan(conn, sql, params):
+    return "; ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+def time_writes(path, count=1000):
+    # Depo üzerinden taşıma: her biri ayrı commit vs. tek işlemde executemany
+    repository = TaskRepository.open(path)
+    rows = repository.conn.execute(
+        "SELECT id, position FROM tasks ORDER BY id LIMIT ?", (count,)).fetchall()
+
+    start = time.perf_counter()
+    for task_id, position in rows:
+        repository.move_many([(task_id, DOING, position)])
+        repository.conn.commit()
+    single = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    repository.move_many([(task_id, TODO, position) for task_id, position in rows])
+    repository.conn.commit()
+    batched = (time.perf_counter() - start) * 1000
+    repository.conn.close()
+
+    print(f"{len(rows)} taşıma: tek tek commit {single:.1f} ms, "
+          f"tek işlemde executemany {batched:.1f} ms")
+
+def run(rows):
+    print(f"\n=== {rows:,} satır ===")
+    with tempfile.TemporaryDirectory() as folder:
+        conn = create_database(os.path.join(folder, "tasks.db"), rows)
+
+        # Son sayfa için kategorinin o sıralamada sondan 51. satırının anahtarını bul
+        queries = []
+        for title, sql, params in QUERIES:
+            if None in params:
+                category, sort_mode, _, _, limit = params
+                key = SORT_MODES[sort_mode][1]
+                last_keys = conn.execute(
+                    f"SELECT {key}, id FROM tasks WHERE completed = 0 AND category = ? "
+                    f"ORDER BY {key} DESC, id DESC LIMIT 51", (category,)).fetchall()
+                value, task_id = last_keys[-1] if last_keys else ("", 0)
+                params = (category, value, value, task_id, limit)
+            queries.append((title, sql, params))
+
+        # Şemanın indekslerini kaldırıp tarama süresini ölç, sonra yeniden oluştur
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL").fetchall()
+        for name, _ in indexes:
+            conn.execute(f"DROP INDEX {name}")
+
+        scan = [time_query(conn, sql, params) for _, sql, params in queries]
+
+        start = time.perf_counter()
+        for _, index_sql in indexes:
+            conn.execute(index_sql)
+        conn.execute("ANALYZE")
+        build = (time.perf_counter() - start) * 1000
+
+        indexed = [time_query(conn, sql, params) for _, sql, params in queries]
+
+        print(f"İndeks oluşturma: {build:.1f} ms")
+        print(f"{'Sorgu':<48}{'Tarama (ms)':>14}{'İndeks (ms)':>14}{'Hızlanma':>10}")
+        for (title, sql, params), before, after in zip(queries, scan, indexed):
+            speedup = before / after if after else float("inf")
+            print(f"{title:<48}{before:>14.3f}{after:>14.3f}{speedup:>9.1f}x")
+            print(f"    plan: {query_plan(conn, sql, params)}")
+        conn.close()
+        time_writes(os.path.join(folder, "tasks.db"))
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    for size in sizes:
+        run(size)
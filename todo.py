@@ -2,15 +2,32 @@ import sys
 import sqlite3
 import warnings
 import os
-from datetime import datetime
+import queue
+import struct
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
+from functools import partial
+from datetime import datetime, timedelta
+from string import Template
+
+# Açılış profili modül yüklemesinden itibaren ölçülür
+STARTUP_STARTED = time.perf_counter()
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                           QHBoxLayout, QPushButton, QLineEdit, QListWidget, 
+                           QHBoxLayout, QPushButton, QLineEdit, QListView, 
                            QLabel, QComboBox, QCalendarWidget, QMessageBox,
-                           QFrame, QScrollArea, QSizePolicy, QListWidgetItem,
-                           QMenu, QDialog, QSystemTrayIcon)
-from PyQt5.QtCore import Qt, QDate, QMimeData, QSize, QPoint, QUrl
-from PyQt5.QtGui import QIcon, QFont, QDrag, QColor, QPalette, QLinearGradient, QGradient, QPixmap
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+                           QFrame, QScrollArea, QSizePolicy, QStyledItemDelegate,
+                           QStyle, QMenu, QDialog, QSystemTrayIcon, QProgressDialog,
+                           QListWidget, QListWidgetItem, QShortcut)
+from PyQt5.QtCore import (Qt, QDate, QMimeData, QSize, QPoint, QRect, QRectF, QUrl,
+                          QAbstractListModel, QItemSelectionModel, QModelIndex, QThread, QTimer,
+                          pyqtSignal)
+from PyQt5.QtGui import (QIcon, QFont, QFontMetrics, QDrag, QColor, QCursor, QPalette, QLinearGradient,
+                         QGradient, QKeySequence, QPixmap, QPixmapCache, QPainter, QPen, QBrush)
 
 # PyQt5 uyarılarını bastır
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -26,169 +43,2504 @@ def resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
-# Ses oynatıcıları
-ADD_PLAYER = None
-DELETE_PLAYER = None
-MOVE_PLAYER = None
+# Sütun içi elle sıralama için sözlük sırasıyla karşılaştırılan sıra değerleri (position).
+# İki komşunun arasına her zaman yeni bir değer sığar; bir kartı taşımak tek satır günceller.
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+# Yeniden dağıtılan değerler sabit genişliktedir; sona eklemeler bu adımla ilerler
+RANK_WIDTH = 6
+RANK_SPACE = RANK_BASE ** RANK_WIDTH
+RANK_STEP = RANK_BASE ** 3
+# Bundan uzun değerler oluşunca sütunun sıra değerleri arka planda yeniden dağıtılır
+RANK_MAX_LENGTH = 16
 
-def init_sounds():
-    global ADD_PLAYER, DELETE_PLAYER, MOVE_PLAYER
+def encode_rank(value):
+    digits = []
+    for _ in range(RANK_WIDTH):
+        value, digit = divmod(value, RANK_BASE)
+        digits.append(RANK_DIGITS[digit])
+    return "".join(reversed(digits))
+
+def spread_ranks(count):
+    # Aralığın ilk yarısına eşit dağılmış, sıralı ve sabit genişlikte `count` değer;
+    # ikinci yarı sona eklemeler için boş kalır
+    step = RANK_SPACE // 2 // (count + 1)
+    return [encode_rank(step * (i + 1)) for i in range(count)]
+
+def rank_between(before, after):
+    """before < sonuç < after olan en kısa değerlerden birini döndürür; None sınırsız demektir."""
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Geçersiz sıra aralığı: {before!r} >= {after!r}")
+    before = before or ""
+    digits = []
+    upper_open = after is None
+    i = 0
+    while True:
+        low = RANK_DIGITS.index(before[i]) if i < len(before) else 0
+        high = RANK_BASE if upper_open else RANK_DIGITS.index(after[i])
+        if high - low > 1:
+            digits.append(RANK_DIGITS[(low + high) // 2])
+            return "".join(digits)
+        digits.append(RANK_DIGITS[low])
+        if high - low == 1:
+            # Bu basamakta after'dan küçük kaldık; sonrası üstten sınırsız
+            upper_open = True
+        i += 1
+
+def rank_after(last):
+    # Sütunun sonuna ekleme: sabit genişlikte adım atılır, yer kalmazsa araya girilir
+    if not last:
+        return encode_rank(RANK_STEP)
+    value = int(last[:RANK_WIDTH].ljust(RANK_WIDTH, "0"), RANK_BASE) + RANK_STEP
+    if value < RANK_SPACE:
+        return encode_rank(value)
+    # Sabit aralık doldu: son basamağı artır, o da dolduysa bir basamak ekle
+    if len(last) > RANK_WIDTH and last[-1] != RANK_DIGITS[-1]:
+        return last[:-1] + RANK_DIGITS[RANK_DIGITS.index(last[-1]) + 1]
+    return last + RANK_DIGITS[1]
+
+# Kategori ve öncelik kodları; veritabanında, bellekte ve anlık görüntüde bu küçük tamsayılar
+# tutulur. Görünen adlar sadece çizerken bu listelerden (kod sırasıyla) okunur.
+CATEGORIES = ["Yapılacak", "Yapılıyor", "Bitti", "Dilek Listesi"]
+PRIORITIES = ["Düşük", "Orta", "Yüksek"]
+TODO, DOING, DONE, WISHLIST = range(len(CATEGORIES))
+LOW, MEDIUM, HIGH = range(len(PRIORITIES))
+
+def category_name(category):
+    # Eski veritabanlarından gelen bilinmeyen kategoriler hiçbir sütunda gösterilmez
+    return CATEGORIES[category] if 0 <= category < len(CATEGORIES) else ""
+
+# Görev tablosu indeksleri
+TASK_INDEXES = [
+    # Pano filtreleri ve sayımlar için kapsayan indeks
+    """CREATE INDEX IF NOT EXISTS idx_tasks_board
+       ON tasks (completed, category, priority, due_date)""",
+    # Sütun sayfaları: (kategori, id) keyset sırası; id (rowid) indekse dahildir
+    """CREATE INDEX IF NOT EXISTS idx_tasks_page
+       ON tasks (completed, category)""",
+]
+# Sütun sayfaları: (kategori, sıra, id) keyset sırası; idx_tasks_page'in yerini alır
+POSITION_INDEX = """CREATE INDEX IF NOT EXISTS idx_tasks_position
+   ON tasks (completed, category, position)"""
+
+# Öncelik sırası için tek sıralama ifadesi: öncelik derecesi (Yüksek önce), ardından bitiş tarihi.
+# Keyset aralığı tek ifade üzerinde olduğundan indekste doğrudan aranabilir
+PRIORITY_SORT_SQL = f"(({HIGH} - priority) || due_date)"
+# Sütun sıralama kipleri: kip -> (başlık, SQL sıralama ifadesi). Sayfalar (ifade, id)
+# keyset'iyle okunur; her ifadenin (completed, category, ifade) indeksi sayfaları sıralı döndürür
+SORT_MODES = {
+    "manual": ("✋ Elle", "position"),
+    "priority": ("⚡ Öncelik", PRIORITY_SORT_SQL),
+    "due": ("📅 Bitiş Tarihi", "due_date"),
+    "created": ("🆕 En Yeni", "-id"),
+}
+# Elle sıralama idx_tasks_position'ı kullanır
+SORT_INDEXES = [
+    f"""CREATE INDEX IF NOT EXISTS idx_tasks_priority_sort
+       ON tasks (completed, category, {PRIORITY_SORT_SQL})""",
+    """CREATE INDEX IF NOT EXISTS idx_tasks_due
+       ON tasks (completed, category, due_date)""",
+    """CREATE INDEX IF NOT EXISTS idx_tasks_created
+       ON tasks (completed, category, -id)""",
+]
+# 5. göçün metin kategorili/öncelikli şemadaki hali; 6. göç tabloyu yeniden kurarken kaldırır
+TEXT_SORT_INDEXES = [
+    """CREATE INDEX IF NOT EXISTS idx_tasks_priority_sort
+       ON tasks (completed, category, (CASE priority WHEN 'Yüksek' THEN '0'
+                                       WHEN 'Orta' THEN '1' ELSE '2' END || due_date))""",
+] + SORT_INDEXES[1:]
+
+# 4. göçün katlanmamış başlık indeksi; 7. göç katlanmış başlıklarla yeniden kurar
+RAW_SEARCH_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+           title, content='tasks', content_rowid='id',
+           tokenize='unicode61 remove_diacritics 2', prefix='2 3')""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+           INSERT INTO tasks_fts (rowid, title) VALUES (new.id, new.title);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+           INSERT INTO tasks_fts (tasks_fts, rowid, title) VALUES ('delete', old.id, old.title);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title ON tasks BEGIN
+           INSERT INTO tasks_fts (tasks_fts, rowid, title) VALUES ('delete', old.id, old.title);
+           INSERT INTO tasks_fts (rowid, title) VALUES (new.id, new.title);
+       END""",
+    "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')",
+]
+# Başlıklar üzerinde tam metin arama; tasks tablosuyla tetikleyiciler üzerinden eşitlenir.
+# İndekslenen metin, bellekteki süzgeçle aynı katlanmış kelimelerdir (search_text SQL
+# fonksiyonu, configure_connection kaydeder); unicode61 ı harfini i'ye çevirmez
+SEARCH_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+           words, content='', tokenize='unicode61 remove_diacritics 0', prefix='2 3')""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+           INSERT INTO tasks_fts (rowid, words) VALUES (new.id, search_text(new.title));
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+           INSERT INTO tasks_fts (tasks_fts, rowid, words)
+           VALUES ('delete', old.id, search_text(old.title));
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title ON tasks BEGIN
+           INSERT INTO tasks_fts (tasks_fts, rowid, words)
+           VALUES ('delete', old.id, search_text(old.title));
+           INSERT INTO tasks_fts (rowid, words) VALUES (new.id, search_text(new.title));
+       END""",
+    "INSERT INTO tasks_fts (rowid, words) SELECT id, search_text(title) FROM tasks",
+]
+
+def create_search_index(conn, schema=SEARCH_SCHEMA):
+    # FTS5 olmadan derlenmiş SQLite'ta arama LIKE taramasıyla yapılır
     try:
-        ADD_PLAYER = QMediaPlayer()
-        ADD_PLAYER.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path("add.wav"))))
-        
-        DELETE_PLAYER = QMediaPlayer()
-        DELETE_PLAYER.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path("delete.wav"))))
+        conn.execute(schema[0])
+    except sqlite3.OperationalError as e:
+        print(f"Tam metin arama kullanılamıyor: {e}")
+        return
+    for sql in schema[1:]:
+        conn.execute(sql)
+
+def fold_search_index(conn):
+    # Katlanmamış başlık indeksini kaldırıp katlanmış kelimelerle yeniden kur
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone() is None:
+        return
+    for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE tasks_fts")
+    create_search_index(conn)
+
+def search_terms(text):
+    # Arama metninin katlanmış kelimeleri; her biri başlıktaki bir kelimenin öneki olmalıdır.
+    # Sadece noktalamadan oluşan parçalar kelime vermez ve aramaya katılmaz
+    return search_words(text)
+
+def search_text(title):
+    # Başlığın indekslenen hali: katlanmış kelimeler boşlukla ayrılmış
+    return " ".join(search_words(title))
+
+def fts_query(terms):
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+def backfill_positions(conn):
+    # Mevcut görevlere kategori içinde id sırasıyla eşit aralıklı sıra değerleri ver
+    categories = [row[0] for row in conn.execute("SELECT DISTINCT category FROM tasks")]
+    for category in categories:
+        task_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM tasks WHERE category = ? ORDER BY id", (category,))]
+        conn.executemany("UPDATE tasks SET position = ? WHERE id = ?",
+                         zip(spread_ranks(len(task_ids)), task_ids))
+
+def create_code_tables(conn):
+    # Kodların adlarını veren arama tabloları; kod, listedeki sıradır
+    for table, names in (("categories", CATEGORIES), ("priorities", PRIORITIES)):
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+        """)
+        conn.executemany(f"INSERT OR IGNORE INTO {table} (id, name) VALUES (?, ?)",
+                         enumerate(names))
+
+def normalize_task_codes(conn):
+    # Metin kategori ve öncelikleri kodlara çevirerek tasks tablosunu yeniden kur.
+    # Bilinmeyen kategoriler kaybolmasın diye yeni kodlar alır; bilinmeyen öncelik Düşük olur
+    conn.execute("""
+        INSERT INTO categories (name)
+        SELECT DISTINCT category FROM tasks WHERE category NOT IN (SELECT name FROM categories)
+    """)
+    sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'").fetchone()
+    has_search_index = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone() is not None
+    conn.execute("""
+        CREATE TABLE tasks_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            category INTEGER NOT NULL REFERENCES categories (id),
+            priority INTEGER NOT NULL REFERENCES priorities (id),
+            due_date TEXT NOT NULL,
+            completed INTEGER DEFAULT 0,
+            position TEXT NOT NULL DEFAULT ''
+        )
+    """)
+    conn.execute(f"""
+        INSERT INTO tasks_new (id, title, category, priority, due_date, completed, position)
+        SELECT t.id, t.title, c.id, COALESCE(p.id, {LOW}), t.due_date, t.completed, t.position
+        FROM tasks AS t
+        JOIN categories AS c ON c.name = t.category
+        LEFT JOIN priorities AS p ON p.name = t.priority
+    """)
+    # Eski tablonun indeksleri ve tetikleyicileri onunla birlikte kalkar
+    conn.execute("DROP TABLE tasks")
+    conn.execute("ALTER TABLE tasks_new RENAME TO tasks")
+    # Silinmiş görevlerin id'leri yeniden kullanılmasın
+    if sequence:
+        conn.execute("DELETE FROM sqlite_sequence WHERE name = 'tasks'")
+        conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('tasks', ?)", sequence)
+    # id ve başlıklar değişmediğinden arama indeksi geçerli; sadece tetikleyiciler yeniden kurulur
+    if has_search_index:
+        for sql in RAW_SEARCH_SCHEMA[1:4]:
+            conn.execute(sql)
+    # Kayıtlı sütun sıralamaları 'sort:<kategori adı>' yerine 'sort:<kod>' anahtarıyla tutulur
+    conn.execute("""
+        UPDATE settings
+        SET key = 'sort:' || (SELECT id FROM categories WHERE name = substr(settings.key, 6))
+        WHERE key LIKE 'sort:%' AND substr(key, 6) IN (SELECT name FROM categories)
+    """)
+
+# Arama kutusunda yazma durduktan sonra aramaya kadar beklenen süre
+SEARCH_DELAY_MS = 150
+# Trigram indeksi kurulurken her olay döngüsü turunda okunan satır sayısı
+TASK_INDEX_SLICE = 500
+
+# Şema göçleri; uygulanan son göç PRAGMA user_version içinde tutulur.
+# Her göç, SQL cümlelerinden ya da bağlantı alan fonksiyonlardan oluşan bir adım listesidir.
+MIGRATIONS = [
+    # 1: temel şema (eski veritabanlarında zaten vardır)
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            category TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            due_date TEXT NOT NULL,
+            completed INTEGER DEFAULT 0
+        )
+        ''',
+        # Tema tercihi için tablo
+        '''
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        ''',
+    ],
+    # 2: pano indeksleri
+    TASK_INDEXES,
+    # 3: sütun içi elle sıralama
+    [
+        "ALTER TABLE tasks ADD COLUMN position TEXT NOT NULL DEFAULT ''",
+        backfill_positions,
+        "DROP INDEX IF EXISTS idx_tasks_page",
+        POSITION_INDEX,
+    ],
+    # 4: başlıklarda tam metin arama
+    [partial(create_search_index, schema=RAW_SEARCH_SCHEMA)],
+    # 5: sütun sıralama kipleri
+    TEXT_SORT_INDEXES,
+    # 6: kategori ve öncelik kodları; tablo yeniden kurulduğundan indeksleri de yeniden oluşur
+    [create_code_tables, normalize_task_codes, TASK_INDEXES[0], POSITION_INDEX] + SORT_INDEXES,
+    # 7: arama indeksi bellekteki süzgeçle aynı katlanmış kelimeleri tutar
+    [fold_search_index],
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+# Uzun adımlarda ilerleme bildirimi sıklığı (SQLite VM komutu)
+MIGRATION_PROGRESS_INTERVAL = 200000
+
+def migrate_database(conn, progress=None):
+    """Veritabanını tek bir işlem içinde en son şema sürümüne yükseltir.
+
+    progress(tamamlanan_adım, toplam_adım) her adımdan sonra ve indeks
+    oluşturma gibi uzun adımların içinde düzenli aralıklarla çağrılır.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return version
+        
+    steps = [step for migration in MIGRATIONS[version:] for step in migration]
+    done = 0
+    
+    def tick():
+        progress(done, len(steps))
+        return 0
         
-        MOVE_PLAYER = QMediaPlayer()
-        MOVE_PLAYER.setMedia(QMediaContent(QUrl.fromLocalFile(resource_path("move.wav"))))
+    if progress:
+        conn.set_progress_handler(tick, MIGRATION_PROGRESS_INTERVAL)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for step in steps:
+            if callable(step):
+                step(conn)
+            else:
+                conn.execute(step)
+            done += 1
+            if progress:
+                progress(done, len(steps))
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+    return SCHEMA_VERSION
+
+def configure_connection(conn):
+    # WAL: okuyucular yazıcıyı beklemez, commit başına fsync gerekmez
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # ~16 MB sayfa önbelleği ve 256 MB bellek eşlemesi
+    conn.execute("PRAGMA cache_size = -16000")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    # Arama indeksinin tetikleyicileri başlığı bununla katlar
+    conn.create_function("search_text", 1, search_text, deterministic=True)
+    return conn
+
+# Ses dosyaları; her biri bellekte çözülmüş halde birkaç ses kanalıyla çalınır
+SOUND_FILES = {
+    "add": "add.wav",
+    "delete": "delete.wav",
+    "move": "move.wav",
+}
+# Aynı sesin üst üste binebilecek en fazla çalma sayısı
+SOUND_VOICES = 3
+# Bu süreden (saniye) daha sık gelen aynı ses istekleri tek çalmada birleştirilir
+SOUND_MIN_INTERVAL = 0.08
+
+class SoundEngine:
+    """WAV dosyalarını bir kez yükleyip QSoundEffect ses havuzuyla çalar."""
+
+    def __init__(self, files=SOUND_FILES, voices=SOUND_VOICES, min_interval=SOUND_MIN_INTERVAL):
+        # QtMultimedia ağır bir modül; ilk kare çizildikten sonra yüklenir
+        from PyQt5.QtMultimedia import QSoundEffect
+        
+        self.min_interval = min_interval
+        self._voices = {}
+        self._next_voice = {}
+        self._last_played = {}
+        for name, file_name in files.items():
+            source = QUrl.fromLocalFile(resource_path(file_name))
+            pool = []
+            for _ in range(voices):
+                effect = QSoundEffect()
+                effect.setSource(source)
+                pool.append(effect)
+            self._voices[name] = pool
+            self._next_voice[name] = 0
+            self._last_played[name] = 0.0
+
+    def play(self, name):
+        pool = self._voices.get(name)
+        if not pool:
+            return
+        # Toplu işlemlerde onlarca çalma yerine tek çalma
+        now = time.monotonic()
+        if now - self._last_played[name] < self.min_interval:
+            return
+        self._last_played[name] = now
+        
+        # Boş bir kanal seç; hepsi çalıyorsa en eskisini baştan başlat
+        start = self._next_voice[name]
+        for offset in range(len(pool)):
+            index = (start + offset) % len(pool)
+            if not pool[index].isPlaying():
+                break
+        else:
+            index = start
+            pool[index].stop()
+        self._next_voice[name] = (index + 1) % len(pool)
+        pool[index].play()
+
+SOUND_ENGINE = None
+
+def init_sounds():
+    global SOUND_ENGINE
+    try:
+        SOUND_ENGINE = SoundEngine()
     except Exception as e:
         print(f"Ses yükleme hatası: {e}")
 
+def play_sound(name):
+    if SOUND_ENGINE:
+        SOUND_ENGINE.play(name)
+
 def play_add_sound():
-    if ADD_PLAYER:
-        ADD_PLAYER.setPosition(0)
-        ADD_PLAYER.play()
+    play_sound("add")
 
 def play_delete_sound():
-    if DELETE_PLAYER:
-        DELETE_PLAYER.setPosition(0)
-        DELETE_PLAYER.play()
+    play_sound("delete")
 
 def play_move_sound():
-    if MOVE_PLAYER:
-        MOVE_PLAYER.setPosition(0)
-        MOVE_PLAYER.play()
+    play_sound("move")
 
-class TaskCard(QWidget):
-    def __init__(self, task_id, title, category, priority, due_date, parent=None):
-        super().__init__(parent)
-        self.task_id = task_id
+class StartupProfiler:
+    """Açılış aşamalarının sürelerini toplar; --profile-startup ile yazdırılır."""
+
+    def __init__(self, enabled=False, started=None):
+        self.enabled = enabled
+        self.started = started if started is not None else time.perf_counter()
+        self.last = self.started
+        self.phases = []
+
+    def mark(self, phase):
+        # Önceki işaretten bu yana geçen süreyi aşamaya yaz
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    def report(self):
+        if not self.enabled:
+            return
+        print("Açılış profili:")
+        for phase, elapsed in self.phases:
+            print(f"  {phase:<32}{elapsed:>9.1f} ms")
+        print(f"  {'Toplam':<32}{(self.last - self.started) * 1000:>9.1f} ms")
+
+class Task:
+    """Tek bir görevin hafif kaydı; değiştirmek yerine replace() ile kopyalanır."""
+    __slots__ = ("id", "title", "category", "priority", "due_date", "position")
+
+    def __init__(self, task_id, title, category, priority, due_date, position=""):
+        self.id = task_id
         self.title = title
+        # CATEGORIES ve PRIORITIES kodları
         self.category = category
         self.priority = priority
         self.due_date = due_date
-        self.setMinimumHeight(80)
-        self.setFixedWidth(320)
-        self.dark_mode = False
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(4)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setAlignment(Qt.AlignCenter)
-        
-        # Başlık
-        self.title_label = QLabel(title)
-        self.title_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.title_label.setWordWrap(True)
-        self.title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self.title_label)
-        
-        # Alt bilgiler için container
-        bottom_widget = QWidget()
-        bottom_layout = QHBoxLayout(bottom_widget)
-        bottom_layout.setContentsMargins(0, 0, 0, 0)
-        bottom_layout.setSpacing(8)
-        bottom_layout.setAlignment(Qt.AlignCenter)
-        
-        # Öncelik ve tarih
-        self.priority_label = QLabel(f"⚡ {priority}")
-        self.priority_label.setFont(QFont("Segoe UI", 9))
-        
-        # Tarihi kısalt
-        date_obj = QDate.fromString(due_date, "yyyy-MM-dd")
-        formatted_date = date_obj.toString("dd.MM.yy")
-        self.date_label = QLabel(f"📅 {formatted_date}")
-        self.date_label.setFont(QFont("Segoe UI", 9))
-        
-        bottom_layout.addWidget(self.priority_label)
-        bottom_layout.addWidget(self.date_label)
-        
-        layout.addWidget(bottom_widget)
-        
-        # Renk ve stil ayarları
-        self.updateStyle()
+        # Sütun içindeki elle verilmiş sıra (rank_between ile üretilir)
+        self.position = position
 
-    def updateStyle(self, dark_mode=False):
-        self.dark_mode = dark_mode
-        text_color = "#ffffff" if dark_mode else "#1a202c"
-        
-        if self.priority == "Yüksek":
-            if dark_mode:
-                color = "#9B2C2C"
-                gradient = "#C53030"
-                border = "#FC8181"
-            else:
-                color = "#FFF5F5"
-                gradient = "#FED7D7"
-                border = "#FEB2B2"
-        elif self.priority == "Orta":
-            if dark_mode:
-                color = "#975A16"
-                gradient = "#B7791F"
-                border = "#F6AD55"
+    @classmethod
+    def from_row(cls, row):
+        return cls(row[0], row[1], row[2], row[3], row[4], row[5])
+
+    def as_row(self):
+        return (self.id, self.title, self.category, self.priority, self.due_date, self.position)
+
+    def replace(self, title=None, category=None, priority=None, due_date=None, position=None):
+        return Task(self.id,
+                    self.title if title is None else title,
+                    self.category if category is None else category,
+                    self.priority if priority is None else priority,
+                    self.due_date if due_date is None else due_date,
+                    self.position if position is None else position)
+
+    def __eq__(self, other):
+        return isinstance(other, Task) and self.as_row() == other.as_row()
+
+    def __repr__(self):
+        return f"Task{self.as_row()!r}"
+
+class TaskStore:
+    """Yüklü görevleri sütun dizilerinde tutan bellek deposu.
+
+    Görünümler satırlarını buradan çizer. Görev başına Python nesnesi tutulmaz:
+    sayısal alanlar dizilerde, başlık ve sıra değerleri tek bir UTF-8 tamponunda,
+    id -> satır eşlemesi de açık adresli bir tamsayı tablosunda durur. Görev
+    başına ~40 bayt artı metnin kendisi harcanır; Task nesnesi sadece okunurken oluşur.
+    """
+    # Tablo hücresinin boş ya da silinmiş olduğunu gösteren değerler
+    EMPTY = -1
+    DELETED = -2
+    # Çöp bu kadar bayttan ve canlı metinden büyükse tampon sıkıştırılır
+    COMPACT_BYTES = 1 << 16
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._ids = array('q')
+        self._categories = array('b')
+        self._priorities = array('b')
+        # Tarihler YYYYAAGG tamsayısı olarak tutulur
+        self._dates = array('i')
+        # Satırın başlığı ve sıra değeri _text içinde art arda durur
+        self._text = bytearray()
+        self._text_at = array('q')
+        self._title_lengths = array('I')
+        self._position_lengths = array('H')
+        self._garbage = 0
+        # id -> satır; doğrusal yoklamalı, boyu ikinin kuvveti
+        self._table = array('i', [self.EMPTY]) * 8
+        self._used = 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, task_id):
+        return self._probe(task_id)[1] >= 0
+
+    @staticmethod
+    def encode_date(due_date):
+        try:
+            return int(due_date.replace("-", ""))
+        except (AttributeError, ValueError):
+            return 0
+
+    @staticmethod
+    def decode_date(value):
+        if not value:
+            return ""
+        return f"{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}"
+
+    def _probe(self, task_id):
+        # (tablo hücresi, satır); görev yoksa satır -1 ve hücre eklenebilecek ilk yerdir
+        table, ids = self._table, self._ids
+        mask = len(table) - 1
+        index = task_id * 0x9E3779B1
+        index = (index ^ (index >> 16)) & mask
+        free = -1
+        while True:
+            slot = table[index]
+            if slot == self.EMPTY:
+                return (index if free < 0 else free), -1
+            if slot == self.DELETED:
+                if free < 0:
+                    free = index
+            elif ids[slot] == task_id:
+                return index, slot
+            index = (index + 1) & mask
+
+    def _rehash(self):
+        # Silinmiş hücreleri atarak tabloyu doluluk üçte birin altında kalacak boyda kurar
+        size = 8
+        while size < len(self._ids) * 3:
+            size *= 2
+        self._table = array('i', [self.EMPTY]) * size
+        self._used = len(self._ids)
+        for slot, task_id in enumerate(self._ids):
+            self._table[self._probe(task_id)[0]] = slot
+
+    def _compact(self):
+        # Güncellemelerden kalan eski metni atarak tamponu satır sırasıyla yeniden yazar
+        text = bytearray()
+        for slot, start in enumerate(self._text_at):
+            self._text_at[slot] = len(text)
+            text += self._text[start:start + self._title_lengths[slot] + self._position_lengths[slot]]
+        self._text = text
+        self._garbage = 0
+
+    def _drop_text(self, slot):
+        self._garbage += self._title_lengths[slot] + self._position_lengths[slot]
+        if self._garbage > max(self.COMPACT_BYTES, len(self._text) - self._garbage):
+            self._compact()
+
+    def put(self, task):
+        index, slot = self._probe(task.id)
+        title = task.title.encode("utf-8")
+        position = task.position.encode("utf-8")
+        if slot < 0:
+            if self._table[index] == self.EMPTY:
+                self._used += 1
+            self._table[index] = len(self._ids)
+            self._ids.append(task.id)
+            self._categories.append(task.category)
+            self._priorities.append(task.priority)
+            self._dates.append(self.encode_date(task.due_date))
+            self._text_at.append(len(self._text))
+            self._title_lengths.append(len(title))
+            self._position_lengths.append(len(position))
+            self._text += title + position
+            if self._used * 3 > len(self._table) * 2:
+                self._rehash()
+            return
+        self._categories[slot] = task.category
+        self._priorities[slot] = task.priority
+        self._dates[slot] = self.encode_date(task.due_date)
+        start = self._text_at[slot]
+        end = start + self._title_lengths[slot] + self._position_lengths[slot]
+        # Çoğu güncelleme metne dokunmaz; değişen metin tamponun sonuna yazılır
+        if (self._title_lengths[slot] != len(title)
+                or self._text[start:end] != title + position):
+            self._drop_text(slot)
+            self._text_at[slot] = len(self._text)
+            self._title_lengths[slot] = len(title)
+            self._position_lengths[slot] = len(position)
+            self._text += title + position
+
+    def put_many(self, tasks):
+        for task in tasks:
+            self.put(task)
+
+    def get(self, task_id):
+        slot = self._probe(task_id)[1]
+        if slot < 0:
+            return None
+        start = self._text_at[slot]
+        middle = start + self._title_lengths[slot]
+        return Task(task_id, self._text[start:middle].decode("utf-8"),
+                    self._categories[slot], self._priorities[slot],
+                    self.decode_date(self._dates[slot]),
+                    self._text[middle:middle + self._position_lengths[slot]].decode("utf-8"))
+
+    def remove(self, task_id):
+        # Son satırı boşalan yere taşıyarak diziler sıkışık tutulur
+        index, slot = self._probe(task_id)
+        if slot < 0:
+            return
+        self._table[index] = self.DELETED
+        self._drop_text(slot)
+        last = len(self._ids) - 1
+        if slot != last:
+            moved_id = self._ids[last]
+            self._table[self._probe(moved_id)[0]] = slot
+            for column in (self._ids, self._categories, self._priorities, self._dates,
+                           self._text_at, self._title_lengths, self._position_lengths):
+                column[slot] = column[last]
+        for column in (self._ids, self._categories, self._priorities, self._dates,
+                       self._text_at, self._title_lengths, self._position_lengths):
+            column.pop()
+        if not self._ids:
+            self.clear()
+
+    def category_of(self, task_id):
+        slot = self._probe(task_id)[1]
+        if slot < 0:
+            return None
+        return self._categories[slot]
+
+    def ids_where(self, task_ids, priorities=(), low=0, high=0):
+        # task_ids içinden önceliği priorities içinde olan ve YYYYAAGG tarihi [low, high]
+        # aralığına düşenler; boş koşul sınır koymaz. Task nesnesi oluşturulmaz
+        matched = []
+        for task_id in task_ids:
+            slot = self._probe(task_id)[1]
+            if slot < 0:
+                continue
+            if priorities and self._priorities[slot] not in priorities:
+                continue
+            due_date = self._dates[slot]
+            if (low and due_date < low) or (high and due_date > high):
+                continue
+            matched.append(task_id)
+        return matched
+
+class TaskFilter:
+    """Panonun süzgeci: arama metni, öncelikler, bitiş tarihi aralığı, gecikenler ve bu hafta.
+
+    Tarih koşulları oluşturulduğu günün tarihine göre tek bir aralığa indirgenir;
+    koşullar sütun indeksleriyle çalışan SQL'e derlenir. Boş süzgeç her görevi kabul eder.
+    """
+
+    def __init__(self, text="", priorities=(), date_from="", date_to="",
+                 overdue=False, this_week=False, today=None):
+        self.text = text.strip()
+        self.terms = search_terms(self.text)
+        # Hepsi seçiliyse öncelik koşulu gereksiz
+        self.priorities = tuple(code for code in range(len(PRIORITIES)) if code in priorities)
+        if len(self.priorities) == len(PRIORITIES):
+            self.priorities = ()
+        self.date_from = date_from
+        self.date_to = date_to
+        self.overdue = overdue
+        self.this_week = this_week
+        self.today = today or datetime.now().date()
+        self.date_bounds = self._date_bounds()
+
+    def is_empty(self):
+        return not (self.terms or self.priorities or any(self.date_bounds))
+
+    def _date_bounds(self):
+        # (en erken, en geç) YYYY-AA-GG; sınırsız uç "". Tarih koşulu varsa tarihsiz görevler elenir
+        lows = [self.date_from] if self.date_from else []
+        highs = [self.date_to] if self.date_to else []
+        if self.overdue:
+            highs.append((self.today - timedelta(days=1)).isoformat())
+        if self.this_week:
+            monday = self.today - timedelta(days=self.today.weekday())
+            lows.append(monday.isoformat())
+            highs.append((monday + timedelta(days=6)).isoformat())
+        if not lows and not highs:
+            return "", ""
+        return max(lows + ["0"]), min(highs) if highs else ""
+
+    def conditions(self):
+        # Arama metni dışındaki koşullar ve parametreleri; sütun adları tasks tablosununkilerdir
+        conditions, params = [], []
+        if self.priorities:
+            conditions.append(f"priority IN ({', '.join('?' * len(self.priorities))})")
+            params.extend(self.priorities)
+        low, high = self.date_bounds
+        if low:
+            conditions.append("due_date >= ?")
+            params.append(low)
+        if high:
+            conditions.append("due_date <= ?")
+            params.append(high)
+        return conditions, params
+
+    def matches(self, task):
+        # Süzgeci bellekteki göreve uygular. Tam metin aramadaki gibi arama metninin
+        # her kelimesi başlıktaki bir kelimenin öneki olmalıdır
+        if self.priorities and task.priority not in self.priorities:
+            return False
+        low, high = self.date_bounds
+        if (low and task.due_date < low) or (high and task.due_date > high):
+            return False
+        if not self.terms:
+            return True
+        words = search_words(task.title)
+        return all(any(word.startswith(term) for word in words) for term in self.terms)
+
+class CommandHistory:
+    """Geri al/yinele geçmişi; sınırlı bir halkada tutulur.
+
+    Her komut sadece etkilediği görevlerin (önceki, sonraki) hallerini saklar;
+    None görevin o anda olmadığı anlamına gelir (ekleme/silme).
+    """
+    LIMIT = 200
+
+    def __init__(self, limit=LIMIT):
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = deque(maxlen=limit)
+
+    def record(self, changes):
+        changes = tuple((before, after) for before, after in changes if before != after)
+        if changes:
+            self.undo_stack.append(changes)
+            self.redo_stack.clear()
+
+    def undo(self):
+        # Uygulanacak (şimdiki, hedef) çiftleri; geçmiş boşsa None
+        if not self.undo_stack:
+            return None
+        changes = self.undo_stack.pop()
+        self.redo_stack.append(changes)
+        return [(after, before) for before, after in changes]
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        changes = self.redo_stack.pop()
+        self.undo_stack.append(changes)
+        return list(changes)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+# Bulanık arama için Türkçe harf katlama: ı/İ/I -> i, ş -> s, ğ -> g, ü -> u, ö -> o, ç -> c
+TURKISH_FOLD = str.maketrans("İIıŞşĞğÜüÖöÇçÂâÎîÛû", "iiissgguuooccaaiiuu")
+
+def fold_text(text):
+    return text.translate(TURKISH_FOLD).lower()
+
+def search_words(text):
+    # Katlanmış, aksanları atılmış harf/rakam dizileri; FTS5 unicode61 ayırıcısına yakındır
+    text = unicodedata.normalize("NFKD", fold_text(text))
+    return "".join(ch if ch.isalnum() else " " for ch in text
+                   if not unicodedata.combining(ch)).split()
+
+def trigrams(text):
+    # Kelimeler arasına iki, başa iki ve sona bir boşluk konur; kısa kelimeler de trigram verir
+    padded = "  " + "  ".join(fold_text(text).split()) + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class TrigramIndex:
+    """Görev başlıkları için bellekteki trigram indeksi; yazım hatalarına dayanıklı arama yapar.
+
+    Görevler eklendikçe, düzenlendikçe ve silindikçe artımlı güncellenir.
+    Eskiyen kayıtlar listelerden hemen silinmez; aramada elenir ve sayıları
+    canlı kayıtların yarısını geçince indeks bellekteki başlıklardan yeniden kurulur.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        # trigram -> görev id dizisi
+        self._postings = {}
+        # görev id -> (başlık, kategori)
+        self._entries = {}
+        self._live = 0
+        self._stale = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def category_of(self, task_id):
+        entry = self._entries.get(task_id)
+        return entry[1] if entry else None
+
+    def put(self, task_id, title, category):
+        old = self._entries.get(task_id)
+        self._entries[task_id] = (title, category)
+        if old is not None:
+            if old[0] == title:
+                return
+            self._forget(old[0])
+        self._add_postings(task_id, title)
+
+    def remove(self, task_id):
+        old = self._entries.pop(task_id, None)
+        if old is not None:
+            self._forget(old[0])
+
+    def update(self, tasks):
+        # tasks: {görev id: Task ya da silinenler için None}
+        for task_id, task in tasks.items():
+            if task is None:
+                self.remove(task_id)
             else:
-                color = "#FFFAF0"
-                gradient = "#FEEBC8"
-                border = "#FBD38D"
+                self.put(task_id, task.title, task.category)
+
+    def search(self, text, limit):
+        # En benzer `limit` görev: (id, başlık, kategori); sorgu trigramlarının en az yarısı eşleşmeli
+        query = trigrams(text)
+        if not query or not text.strip():
+            return []
+        needed = max(1, len(query) // 2)
+        # Yeterince eşleşen her başlık en seyrek (len - needed + 1) trigramdan birini içerir;
+        # "gör", "rev" gibi neredeyse her başlıktaki trigramları saymaya gerek yok
+        postings = sorted((self._postings.get(gram, ()) for gram in query), key=len)
+        counts = Counter()
+        for ids in postings[:len(query) - needed + 1]:
+            counts.update(ids)
+        # Sayımlar eksik ya da eski kayıtlar yüzünden fazla olabilir; adaylar gerçek başlıkla puanlanır
+        folded = " ".join(fold_text(text).split())
+        scored = []
+        for task_id, _ in counts.most_common(limit * 5):
+            entry = self._entries.get(task_id)
+            if entry is None:
+                continue
+            grams = trigrams(entry[0])
+            common = len(query & grams)
+            if common >= needed:
+                # Eşit puanda sorguyu aynen içeren ve kısa başlıklar önce gelir
+                loose = folded not in " ".join(fold_text(entry[0]).split())
+                scored.append((-common / len(query), loose, len(grams), task_id))
+        scored.sort()
+        return [(task_id,) + self._entries[task_id] for *_, task_id in scored[:limit]]
+
+    def _add_postings(self, task_id, title):
+        postings = self._postings
+        grams = trigrams(title)
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is None:
+                ids = postings[gram] = array("q")
+            ids.append(task_id)
+        self._live += len(grams)
+
+    def _forget(self, title):
+        count = len(trigrams(title))
+        self._live -= count
+        self._stale += count
+        if self._stale > self._live // 2 + 1000:
+            self._compact()
+
+    def _compact(self):
+        self._postings = {}
+        self._live = self._stale = 0
+        for task_id, (title, _) in self._entries.items():
+            self._add_postings(task_id, title)
+
+# Pano anlık görüntüsü: açılışta veritabanı okunmadan önce çizilecek ilk sayfalar ve tema.
+# Biçim: başlık, ardından CATEGORIES sırasıyla her sütun için görev sayısı, devam bayrağı
+# ve görev kayıtları (id, öncelik kodu, YYYYAAGG tarih, UTF-8 başlık, sıra değeri).
+SNAPSHOT_MAGIC = b"TADU"
+SNAPSHOT_FORMAT = 3
+SNAPSHOT_HEADER = struct.Struct("<4sHHqB")
+SNAPSHOT_COLUMN = struct.Struct("<IB")
+# Başlık ve sıra değeri uzunlukları 32 bit; düzenleme kutusu 65535 bayttan uzun başlık alabilir
+SNAPSHOT_TASK = struct.Struct("<qblII")
+
+def write_board_snapshot(path, board_version, dark, columns):
+    """columns: CATEGORIES sırasıyla (görevler, devamı_var) çiftleri."""
+    parts = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, SCHEMA_VERSION,
+                                  board_version, int(dark))]
+    for tasks, has_more in columns:
+        parts.append(SNAPSHOT_COLUMN.pack(len(tasks), int(has_more)))
+        for task in tasks:
+            title = task.title.encode("utf-8")
+            position = task.position.encode("ascii")
+            parts.append(SNAPSHOT_TASK.pack(task.id, task.priority,
+                                            TaskStore.encode_date(task.due_date), len(title),
+                                            len(position)))
+            parts.append(title)
+            parts.append(position)
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(temp_path, path)
+
+def read_board_snapshot(path):
+    """(pano sürümü, koyu tema, sütunlar) döndürür; dosya yoksa ya da geçersizse None."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, file_format, schema, board_version, dark = SNAPSHOT_HEADER.unpack_from(data, 0)
+        if (magic, file_format, schema) != (SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, SCHEMA_VERSION):
+            return None
+        offset = SNAPSHOT_HEADER.size
+        columns = []
+        for category in range(len(CATEGORIES)):
+            count, has_more = SNAPSHOT_COLUMN.unpack_from(data, offset)
+            offset += SNAPSHOT_COLUMN.size
+            tasks = []
+            for _ in range(count):
+                task_id, priority, due_date, length, position_length = \
+                    SNAPSHOT_TASK.unpack_from(data, offset)
+                offset += SNAPSHOT_TASK.size
+                title = data[offset:offset + length].decode("utf-8")
+                offset += length
+                position = data[offset:offset + position_length].decode("ascii")
+                offset += position_length
+                tasks.append(Task(task_id, title, category, priority,
+                                  TaskStore.decode_date(due_date), position))
+            columns.append((tasks, bool(has_more)))
+        return board_version, bool(dark), columns
+    except (OSError, struct.error, UnicodeDecodeError, IndexError):
+        return None
+
+# Sürüklenen kartın taşıdığı tek veri: görev id'si
+TASK_MIME_TYPE = "application/x-tadu-task-id"
+
+def task_id_from_mime(mime):
+    if not mime.hasFormat(TASK_MIME_TYPE):
+        return None
+    try:
+        return int(bytes(mime.data(TASK_MIME_TYPE)).decode("ascii"))
+    except ValueError:
+        return None
+
+class TaskListModel(QAbstractListModel):
+    """Bir kategorideki görevleri sayfa sayfa yükleyen hafif model.
+
+    Model sadece görev id'lerini tutar; görev verisi ortak TaskStore'dan okunur.
+    """
+    TaskRole = Qt.UserRole + 1
+    # Her fetchMore çağrısında yüklenecek satır sayısı
+    PAGE_SIZE = 50
+
+    def __init__(self, category, store, fetch_page=None, resolve_rows=None, parent=None):
+        super().__init__(parent)
+        self.category = category
+        # SORT_MODES anahtarı; sayfalar bu kipin indeksinden sıralı gelir
+        self.sort_mode = "manual"
+        self._store = store
+        # fetch_page(kategori, son_anahtar, limit, sıralama kipi) -> Task listesi
+        self._fetch_page = fetch_page
+        # resolve_rows(kategori, görevler) -> henüz yazılmamış değişiklikler uygulanmış görevler
+        self._resolve_rows = resolve_rows
+        # Görev id'leri ve sıralama anahtarları, anahtara göre sıralı
+        self._ids = []
+        self._keys = []
+        self._key_of = {}
+        # Veritabanından okunan son anahtar ve yüklü aralığın dışına düşen iyimser görevler
+        self._cursor = None
+        self._deferred = {}
+        self._has_more = fetch_page is not None
+        # Süzgeç açıkken asıl sayfalama durumu burada bekler; süzgeç
+        # açıkken model değişirse kapatıldığında sütun yeniden yüklenir
+        self._unfiltered = None
+        self._filter_dirty = False
+        # Açık süzgeç (TaskFilter); eklenen ve değişen görevler de buna uymalıdır
+        self._filter = None
+
+    def sort_key(self, task):
+        # Keyset sayfalama anahtarı: kipin SQL sıralama ifadesinin değeri, eşitlikte id
+        if self.sort_mode == "priority":
+            return (f"{HIGH - task.priority}{task.due_date}", task.id)
+        if self.sort_mode == "due":
+            return (task.due_date, task.id)
+        if self.sort_mode == "created":
+            return (-task.id, task.id)
+        return (task.position, task.id)
+
+    def set_sort_mode(self, sort_mode):
+        # Sütun yeni kipin indeksinden baştan yüklenir; açık süzgeç kapanır
+        if sort_mode == self.sort_mode:
+            return False
+        self.sort_mode = sort_mode
+        self.reload()
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._ids):
+            return None
+        if role == TaskListModel.TaskRole:
+            return self._store.get(self._ids[index.row()])
+        if role == Qt.DisplayRole:
+            return self._store.get(self._ids[index.row()]).title
+        return None
+
+    def flags(self, index):
+        # Kartlar sürüklenebilir; bırakma kartların üstüne değil aralarına yapılır
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemIsDragEnabled
         else:
-            if dark_mode:
-                color = "#276749"
-                gradient = "#2F855A"
-                border = "#68D391"
+            flags |= Qt.ItemIsDropEnabled
+        return flags
+
+    def mimeTypes(self):
+        return [TASK_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        if indexes:
+            mime.setData(TASK_MIME_TYPE, str(self._ids[indexes[0].row()]).encode("ascii"))
+        return mime
+
+    def supportedDragActions(self):
+        return Qt.MoveAction
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        self._fetch(self.PAGE_SIZE)
+
+    def load_through(self, task):
+        # Görevin satırına kadar olan sayfaları büyüyen parçalarla yükle
+        key = self.sort_key(task)
+        limit = self.PAGE_SIZE
+        while self._has_more and (self._cursor is None or self._cursor < key):
+            self._fetch(limit)
+            limit = min(limit * 4, 10000)
+
+    def _fetch(self, limit):
+        tasks = self._fetch_page(self.category, self._cursor, limit, self.sort_mode)
+        if len(tasks) < limit:
+            self._has_more = False
+        if tasks:
+            self._cursor = self.sort_key(tasks[-1])
+        if self._resolve_rows:
+            tasks = self._resolve_rows(self.category, tasks)
+        # Yazılmamış bir değişiklik görevi süzgecin dışına çıkarmış ya da sıralama
+        # anahtarını değiştirmiş olabilir; sayfa yeni anahtarlarla yeniden sıralanır
+        tasks = sorted((task for task in tasks if self.accepts(task)), key=self.sort_key)
+        if self._has_more:
+            # Anahtarı yüklü aralığın ötesine geçen görev o aralık yüklenince eklenir
+            beyond = [task for task in tasks if self.sort_key(task) > self._cursor]
+            self._store.put_many(beyond)
+            for task in beyond:
+                self._deferred[task.id] = self.sort_key(task)
+            tasks = tasks[:len(tasks) - len(beyond)]
+        
+        # Artık yüklü aralığa giren ertelenmiş görevleri ekle
+        if self._deferred:
+            ready = [task_id for task_id, key in self._deferred.items()
+                     if not self._has_more or key <= self._cursor]
+            for task_id in ready:
+                del self._deferred[task_id]
+            # Yazması diske işlenmiş görev sayfada da gelir; iki kez eklenmez
+            fetched = {task.id for task in tasks}
+            tasks = sorted(tasks + [self._store.get(task_id) for task_id in ready
+                                    if task_id not in fetched],
+                           key=self.sort_key)
+        tasks = [task for task in tasks if task.id not in self._key_of]
+        self._store.put_many(tasks)
+        self._add_rows(tasks)
+
+    def _add_rows(self, tasks):
+        # Sıralı görevlerden sona eklenebilenler tek blokta, araya düşenler tek tek eklenir
+        tail = []
+        for task in tasks:
+            if self._keys and self.sort_key(task) < self._keys[-1]:
+                self._insert_row(task)
             else:
-                color = "#F0FFF4"
-                gradient = "#C6F6D5"
-                border = "#9AE6B4"
-            
-        # Ana widget stili
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 {color}, stop:1 {gradient});
-                border: 2px solid {border};
-                border-radius: 8px;
-            }}
-            QLabel {{
-                color: {text_color}; 
-                background: transparent; 
-                padding: 3px;
-                font-weight: bold;
-            }}
+                tail.append(task)
+        if not tail:
+            return
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(tail) - 1)
+        for task in tail:
+            key = self.sort_key(task)
+            self._ids.append(task.id)
+            self._keys.append(key)
+            self._key_of[task.id] = key
+        self.endInsertRows()
+
+    def reload(self):
+        # Modeli boşalt ve ilk sayfayı hemen yükle; açık süzgeç kapanır
+        if self._unfiltered is not None:
+            self._fetch_page = self._unfiltered[-1]
+            self._unfiltered = None
+            self._filter = None
+        self.beginResetModel()
+        self._ids = []
+        self._keys = []
+        self._key_of = {}
+        self._cursor = None
+        self._deferred = {}
+        self._has_more = self._fetch_page is not None
+        self.endResetModel()
+        self.fetchMore()
+
+    def restore(self, tasks, has_more):
+        # Anlık görüntüden gelen ilk satırlarla başla; sonraki sayfalar son anahtardan devam eder
+        tasks = sorted(tasks, key=self.sort_key)
+        self._store.put_many(tasks)
+        self.beginResetModel()
+        self._ids = [task.id for task in tasks]
+        self._keys = [self.sort_key(task) for task in tasks]
+        self._key_of = dict(zip(self._ids, self._keys))
+        self._cursor = self._keys[-1] if self._keys else None
+        self._deferred = {}
+        self._has_more = has_more and self._fetch_page is not None
+        self.endResetModel()
+
+    def snapshot(self, limit):
+        # İlk `limit` satır ve ardından başka satır olup olmadığı; süzgeç açıkken
+        # asıl satırlar kullanılır, bunlar eskidiyse None
+        ids, has_more = self._ids, self._has_more
+        if self._unfiltered is not None:
+            if self._filter_dirty:
+                return None
+            ids, has_more = self._unfiltered[0], self._unfiltered[5]
+        tasks = [self._store.get(task_id) for task_id in ids[:limit]]
+        return tasks, has_more or len(ids) > limit
+
+    def loaded_matches(self, task_filter):
+        # Sütunun tüm satırları zaten yüklüyse metinsiz süzgeç sorgusuz uygulanır; değilse None
+        ids, has_more = self._ids, self._has_more
+        if self._unfiltered is not None:
+            if self._filter_dirty:
+                return None
+            ids, has_more = self._unfiltered[0], self._unfiltered[5]
+        if has_more or task_filter.terms:
+            return None
+        # Tarih koşulu varsa tarihsiz (0) görevler elenir; "0" alt sınırı bunu ifade eder
+        low, high = task_filter.date_bounds
+        low = max(TaskStore.encode_date(low), 1) if low else 0
+        high = TaskStore.encode_date(high) if high else 0
+        matched = self._store.ids_where(ids, task_filter.priorities, low, high)
+        return [self._store.get(task_id) for task_id in matched]
+
+    def set_filter(self, task_filter, tasks, has_more, fetch_page):
+        # Sadece süzgece uyan görevleri göster; sonraki sayfalar fetch_page ile gelir
+        self._filter = task_filter
+        if self._resolve_rows:
+            tasks = self._resolve_rows(self.category, tasks)
+        tasks = sorted((task for task in tasks if self.accepts(task)), key=self.sort_key)
+        if self._unfiltered is None:
+            self._unfiltered = (self._ids, self._keys, self._key_of, self._cursor,
+                                self._deferred, self._has_more, self._fetch_page)
+            self._filter_dirty = False
+        self._store.put_many(tasks)
+        self.beginResetModel()
+        self._ids = [task.id for task in tasks]
+        self._keys = [self.sort_key(task) for task in tasks]
+        self._key_of = dict(zip(self._ids, self._keys))
+        self._cursor = self._keys[-1] if self._keys else None
+        self._deferred = {}
+        self._has_more = has_more
+        self._fetch_page = fetch_page
+        self.endResetModel()
+
+    def clear_filter(self):
+        # Asıl satırlara yeniden yükleme yapmadan dön
+        if self._unfiltered is None:
+            return
+        state, self._unfiltered = self._unfiltered, None
+        self._filter = None
+        if self._filter_dirty:
+            self._fetch_page = state[-1]
+            self.reload()
+            return
+        self.beginResetModel()
+        (self._ids, self._keys, self._key_of, self._cursor,
+         self._deferred, self._has_more, self._fetch_page) = state
+        self.endResetModel()
+
+    def accepts(self, task):
+        return self._filter is None or self._filter.matches(task)
+
+    def _touch(self):
+        # Süzgeç açıkken yapılan değişiklik saklanan asıl satırları eskitir
+        if self._unfiltered is not None:
+            self._filter_dirty = True
+
+    def contains(self, task_id):
+        return task_id in self._key_of or task_id in self._deferred
+
+    def row_of(self, task_id):
+        key = self._key_of.get(task_id)
+        if key is None:
+            return -1
+        return bisect_left(self._keys, key)
+
+    def task_at(self, row):
+        return self._store.get(self._ids[row])
+
+    def get_task(self, task_id):
+        if not self.contains(task_id):
+            return None
+        return self._store.get(task_id)
+
+    def insert_task(self, task):
+        # Henüz yüklenmemiş aralığa düşen görevler sonraki sayfayla gelir
+        self._touch()
+        # Süzgeçle gizlenen görev de depoda güncel tutulur; süzgeç değişince gösterilebilir
+        self._store.put(task)
+        if not self.accepts(task):
+            return False
+        key = self.sort_key(task)
+        if self._has_more and (self._cursor is None or key > self._cursor):
+            self._deferred[task.id] = key
+            return False
+        self._insert_row(task)
+        return True
+
+    def insert_tasks(self, tasks):
+        # Toplu ekleme; yüklü aralığa düşenler tek seferde satırlara eklenir
+        self._touch()
+        self._place(tasks)
+
+    def merge_missing(self, tasks):
+        # Okunan satırlarda henüz bulunmayan görevleri ekle; bunlar süzgeçten önceki
+        # asıl satırlarda zaten olduğundan saklanan durum eskimez
+        self._place([task for task in tasks if not self.contains(task.id)])
+
+    def _place(self, tasks):
+        self._store.put_many(tasks)
+        tasks = [task for task in tasks if self.accepts(task)]
+        ready = []
+        for task in sorted(tasks, key=self.sort_key):
+            key = self.sort_key(task)
+            if self._has_more and (self._cursor is None or key > self._cursor):
+                self._deferred[task.id] = key
+            else:
+                ready.append(task)
+        self._add_rows(ready)
+
+    def _insert_row(self, task):
+        key = self.sort_key(task)
+        row = bisect_left(self._keys, key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.insert(row, task.id)
+        self._keys.insert(row, key)
+        self._key_of[task.id] = key
+        self.endInsertRows()
+
+    def remove_task(self, task_id):
+        # Görevi listeden çıkarır; depodan silmek çağıranın işidir
+        self._touch()
+        task = self._store.get(task_id)
+        row = self.row_of(task_id)
+        if row < 0:
+            return task if self._deferred.pop(task_id, None) is not None else None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        del self._keys[row]
+        del self._key_of[task_id]
+        self.endRemoveRows()
+        return task
+
+    def remove_tasks(self, task_ids):
+        # Toplu çıkarma; ardışık satırlar tek beginRemoveRows bloğunda, alttan üste silinir
+        self._touch()
+        rows = []
+        for task_id in task_ids:
+            row = self.row_of(task_id)
+            if row >= 0:
+                rows.append(row)
+            else:
+                self._deferred.pop(task_id, None)
+        rows.sort(reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for task_id in self._ids[first:last + 1]:
+                del self._key_of[task_id]
+            del self._ids[first:last + 1]
+            del self._keys[first:last + 1]
+            self.endRemoveRows()
+
+    def update_tasks(self, tasks):
+        # Toplu güncelleme; yerinde kalanlar için tek dataChanged yayılır, sıralama
+        # anahtarı değişenler (ör. öncelik sırasında) toplu çıkarılıp yeni yerlerine eklenir
+        self._touch()
+        self._store.put_many(tasks)
+        rows = []
+        moved = []
+        for task in tasks:
+            if not self.contains(task.id):
+                # Süzgeçle gizlenmiş görev artık uyuyorsa insert_tasks yerine ekler
+                if self._filter is not None:
+                    moved.append(task)
+                continue
+            if not self.accepts(task):
+                # Süzgecin dışına çıkan görevi insert_tasks geri eklemez
+                moved.append(task)
+                continue
+            key = self._key_of.get(task.id, self._deferred.get(task.id))
+            if self.sort_key(task) != key:
+                moved.append(task)
+                continue
+            row = self.row_of(task.id)
+            if row >= 0:
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)))
+        if moved:
+            self.remove_tasks([task.id for task in moved])
+            self.insert_tasks(moved)
+
+    def update_task(self, task):
+        self._touch()
+        self._store.put(task)
+        if not self.accepts(task):
+            self.remove_task(task.id)
+            return
+        row = self.row_of(task.id)
+        if row < 0:
+            # Ertelenmiş ya da süzgeçle gizlenmiş görev yeni anahtarıyla yeniden yerleşir
+            if task.id in self._deferred or self._filter is not None:
+                self.remove_task(task.id)
+                self.insert_task(task)
+            return
+        if self.sort_key(task) != self._keys[row]:
+            # Sıralama anahtarı değişti; görevi yeni yerine taşı
+            self.remove_task(task.id)
+            self.insert_task(task)
+            return
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+class TaskRepository:
+    """Görev veritabanına erişen tek katman; arayüzden bağımsız kullanılabilir.
+
+    Yazma metotları işlem açmaz ya da commit etmez; işlem sınırlarını
+    çağıran taraf (DatabaseWorker) belirler.
+    """
+    # Sorgu metinleri sabittir; sqlite3 hazırlanmış ifadeleri bağlantı başına önbelleğe alır
+    INSERT_SQL = """
+        INSERT INTO tasks (id, title, category, priority, due_date, position)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    MOVE_SQL = "UPDATE tasks SET category = ?, position = ? WHERE id = ?"
+    DELETE_SQL = "DELETE FROM tasks WHERE id = ?"
+    PRIORITY_SQL = "UPDATE tasks SET priority = ? WHERE id = ?"
+    UPDATE_SQL = """
+        UPDATE tasks
+        SET title = ?, category = ?, priority = ?, due_date = ?, position = ?
+        WHERE id = ?
+    """
+    # Art arda gelen bu çağrılar tek executemany'de birleştirilebilir
+    MERGEABLE = ("insert_many", "move_many", "delete_many", "set_priority_many", "update_many")
+    STATEMENT_CACHE_SIZE = 256
+
+    # Bu sayıdan az eşleşen aramalarda tüm sonuçlar tek sorguda okunur; daha genel
+    # aramalarda her sütunun sadece ilk sayfası sütun indeksi üzerinden okunur
+    SEARCH_LIMIT = 1000
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._has_search_index = None
+
+    @classmethod
+    def open(cls, db_path, **kwargs):
+        conn = sqlite3.connect(db_path, cached_statements=cls.STATEMENT_CACHE_SIZE, **kwargs)
+        return cls(configure_connection(conn))
+
+    def close(self):
+        # Sorgu planlayıcı istatistiklerini güncel tut
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
+    def migrate(self, progress=None):
+        return migrate_database(self.conn, progress)
+
+    def next_task_id(self):
+        # AUTOINCREMENT id'ler tekrar kullanılmaz; sıradaki id'yi önceden ayırmak için
+        return self.conn.execute("""
+            SELECT MAX(
+                COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'tasks'), 0),
+                COALESCE((SELECT MAX(id) FROM tasks), 0)
+            )
+        """).fetchone()[0] + 1
+
+    @staticmethod
+    def page_sql(sort_mode, first=False, condition=None):
+        # Sütun sayfası: (kategori, ifade, id) üzerinde keyset sayfalama; OFFSET kullanılmaz.
+        # İfadedeki ayrı >= koşulu, satır değeri karşılaştırmasının indekste aranmasını sağlar
+        key = SORT_MODES[sort_mode][1]
+        conditions = ["completed = 0", "category = ?"]
+        if not first:
+            conditions += [f"{key} >= ?", f"({key}, id) > (?, ?)"]
+        if condition:
+            conditions.append(condition)
+        return f"""
+            SELECT id, title, category, priority, due_date, position
+            FROM tasks
+            WHERE {" AND ".join(conditions)}
+            ORDER BY {key}, id
+            LIMIT ?
+        """
+
+    def _read_page(self, category, after_key, limit, sort_mode, condition=None, params=()):
+        sql = self.page_sql(sort_mode, after_key is None, condition)
+        keyset = [after_key[0], after_key[0], after_key[1]] if after_key else []
+        rows = self.conn.execute(sql, [category] + keyset + list(params) + [limit]).fetchall()
+        return [Task.from_row(row) for row in rows]
+
+    def get_page(self, category, after_key, limit, sort_mode="manual"):
+        return self._read_page(category, after_key, limit, sort_mode)
+
+    def has_search_index(self):
+        if self._has_search_index is None:
+            self._has_search_index = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone() is not None
+        return self._has_search_index
+
+    def search_filter(self, terms):
+        # Arama koşulu ve parametreleri; FTS5 yoksa her kelime için katlanmış başlıkta
+        # kelime başı LIKE. Kelimeler harf ve rakamdan oluştuğundan kaçış gerekmez
+        if self.has_search_index():
+            return "id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)", [fts_query(terms)]
+        return (" AND ".join(["(' ' || search_text(title)) LIKE ?"] * len(terms)),
+                [f"% {term}%" for term in terms])
+
+    def filter_condition(self, task_filter):
+        # Süzgecin tüm koşulları tek WHERE parçası olarak
+        conditions, params = task_filter.conditions()
+        terms = task_filter.terms
+        if terms:
+            condition, search_params = self.search_filter(terms)
+            conditions.append(condition)
+            params += search_params
+        return " AND ".join(conditions) or "1", params
+
+    def search(self, task_filter, limit):
+        # Arama metni olan süzgeçte en fazla limit + 1 eşleşme; eşleşmeler FTS'den id ile okunur
+        terms = task_filter.terms
+        if not terms:
+            return []
+        if self.has_search_index():
+            # Süzgeç sütunları sadece tasks tablosunda var; önek gerekmez
+            conditions, params = task_filter.conditions()
+            sql = f"""
+                SELECT t.id, t.title, t.category, t.priority, t.due_date, t.position
+                FROM tasks_fts CROSS JOIN tasks AS t ON t.id = tasks_fts.rowid
+                WHERE {" AND ".join(["tasks_fts MATCH ?", "t.completed = 0"] + conditions)}
+                LIMIT ?
+            """
+            params = [fts_query(terms)] + params
+        else:
+            condition, params = self.filter_condition(task_filter)
+            sql = f"""
+                SELECT id, title, category, priority, due_date, position
+                FROM tasks WHERE completed = 0 AND {condition}
+                LIMIT ?
+            """
+        rows = self.conn.execute(sql, params + [limit + 1]).fetchall()
+        return [Task.from_row(row) for row in rows]
+
+    def filter_page(self, task_filter, category, after_key, limit, sort_mode="manual"):
+        # Sütunun keyset sayfası; sadece süzgece uyan satırlar okunur
+        condition, params = self.filter_condition(task_filter)
+        return self._read_page(category, after_key, limit, sort_mode, condition, params)
+
+    def filter_columns(self, task_filter, sort_modes, page_size):
+        # sort_modes: {kategori: sıralama kipi}; her sütun için (eşleşen görevler, devamı var mı).
+        # Az eşleşen aramalar tek sorguda, diğerleri sütun başına ilk sayfa olarak okunur
+        if task_filter.terms:
+            tasks = self.search(task_filter, self.SEARCH_LIMIT)
+            if len(tasks) <= self.SEARCH_LIMIT:
+                columns = {category: ([], False) for category in sort_modes}
+                for task in tasks:
+                    if task.category in columns:
+                        columns[task.category][0].append(task)
+                return columns
+        columns = {}
+        for category, sort_mode in sort_modes.items():
+            page = self.filter_page(task_filter, category, None, page_size, sort_mode)
+            columns[category] = (page, len(page) == page_size)
+        return columns
+
+    def get_task(self, task_id):
+        row = self.conn.execute(
+            "SELECT id, title, category, priority, due_date, position FROM tasks WHERE id = ?",
+            (task_id,)).fetchone()
+        return Task.from_row(row) if row else None
+
+    def title_rows(self, after_id, limit):
+        # Trigram indeksini kurmak için (id, başlık, kategori) satırları, id sırasıyla
+        return self.conn.execute(
+            "SELECT id, title, category FROM tasks WHERE completed = 0 AND id > ? ORDER BY id LIMIT ?",
+            (after_id, limit)).fetchall()
+
+    def last_position(self, category):
+        # Sütunun son sıra değeri; yeni kartlar bunun arkasına eklenir
+        return self.conn.execute(
+            "SELECT MAX(position) FROM tasks WHERE completed = 0 AND category = ?",
+            (category,)).fetchone()[0]
+
+    def insert_many(self, tasks):
+        self.conn.executemany(self.INSERT_SQL, (task.as_row() for task in tasks))
+
+    def move_many(self, moves):
+        # moves: (görev id, kategori, sıra) üçlüleri; sütun içi taşıma da tek satır günceller
+        self.conn.executemany(self.MOVE_SQL, ((category, position, task_id)
+                                              for task_id, category, position in moves))
+
+    def delete_many(self, task_ids):
+        self.conn.executemany(self.DELETE_SQL, ((task_id,) for task_id in task_ids))
+
+    def set_priority_many(self, task_ids, priority):
+        self.conn.executemany(self.PRIORITY_SQL, ((priority, task_id) for task_id in task_ids))
+
+    def update(self, task):
+        self.conn.execute(self.UPDATE_SQL, (task.title, task.category, task.priority,
+                                            task.due_date, task.position, task.id))
+
+    def update_many(self, tasks):
+        self.conn.executemany(self.UPDATE_SQL, ((task.title, task.category, task.priority,
+                                                 task.due_date, task.position, task.id)
+                                                for task in tasks))
+
+    def rebalance(self, category):
+        # Sütunun sırasını koruyarak sıra değerlerini yeniden eşit aralıklarla dağıt
+        task_ids = [row[0] for row in self.conn.execute(
+            "SELECT id FROM tasks WHERE completed = 0 AND category = ? ORDER BY position, id",
+            (category,))]
+        self.conn.executemany("UPDATE tasks SET position = ? WHERE id = ?",
+                              zip(spread_ranks(len(task_ids)), task_ids))
+
+    def board_version(self):
+        return int(self.get_setting('board_version', 0))
+
+    def bump_board_version(self):
+        # Her yazma grubu panonun sürümünü bir artırır; anlık görüntü bununla doğrulanır
+        self.conn.execute("""
+            INSERT INTO settings (key, value) VALUES ('board_version', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
         """)
 
-class TaskList(QListWidget):
-    def __init__(self, title, parent=None):
+    def sort_modes(self):
+        # Sütunların kayıtlı sıralama kipleri ('sort:<kategori kodu>'); kaydı olmayan elle sıralanır
+        saved = dict(self.conn.execute(
+            "SELECT key, value FROM settings WHERE key LIKE 'sort:%'").fetchall())
+        modes = {}
+        for category in range(len(CATEGORIES)):
+            mode = saved.get(f"sort:{category}")
+            modes[category] = mode if mode in SORT_MODES else "manual"
+        return modes
+
+    def get_setting(self, key, default=None):
+        result = self.conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        return result[0] if result else default
+
+    def set_setting(self, key, value):
+        self.conn.execute("""
+            INSERT OR REPLACE INTO settings (key, value)
+            VALUES (?, ?)
+        """, (key, value))
+
+    @staticmethod
+    def merge_calls(calls):
+        # Art arda gelen aynı tür yazmaları tek çağrıda birleştir
+        merged = []
+        for method, args in calls:
+            if merged and method in TaskRepository.MERGEABLE:
+                last_method, last_args = merged[-1]
+                if last_method == method and last_args[1:] == args[1:]:
+                    merged[-1] = (method, (list(last_args[0]) + list(args[0]),) + args[1:])
+                    continue
+            merged.append((method, args))
+        return merged
+
+class DatabaseWorker(QThread):
+    """Yazma bağlantısının sahibi; yazmaları gruplayıp arka planda tek işlemde uygular."""
+    # İşlenen toplam iş sayısı; kuyruk boşaldığında yayılır
+    idle = pyqtSignal(int)
+    # Başarısız olan depo metodu ve hata mesajı
+    failed = pyqtSignal(str, str)
+    # Bu süre içinde gelen yazmalar tek işlemde birleştirilir (saniye)
+    COMMIT_WINDOW = 0.05
+    MAX_BATCH = 500
+
+    def __init__(self, db_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.jobs = queue.Queue()
+        self.processed = 0
+
+    def submit(self, method, *args):
+        # method: TaskRepository yazma metodunun adı
+        self.jobs.put((method, args))
+
+    def flush(self):
+        # Kuyruktaki tüm yazmalar diske işlenene kadar bekle
+        if not self.isRunning():
+            return
+        done = threading.Event()
+        self.jobs.put(done)
+        done.wait()
+
+    def stop(self):
+        # Kuyruktaki işler bittikten sonra iş parçacığını kapat
+        if self.isRunning():
+            self.jobs.put(None)
+            self.wait()
+
+    def run(self):
+        # İşlemler elle yönetilir (BEGIN/COMMIT)
+        repository = TaskRepository.open(self.db_path, isolation_level=None)
+        running = True
+        while running:
+            job = self.jobs.get()
+            batch = []
+            waiters = []
+            deadline = time.monotonic() + self.COMMIT_WINDOW
+            while True:
+                if job is None:
+                    running = False
+                    break
+                if isinstance(job, threading.Event):
+                    # flush() çağrısı: grubu beklemeden hemen işle
+                    waiters.append(job)
+                    break
+                batch.append(job)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.MAX_BATCH or remaining <= 0:
+                    break
+                try:
+                    job = self.jobs.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if batch:
+                self.apply_batch(repository, batch)
+            for waiter in waiters:
+                waiter.set()
+            if self.jobs.empty():
+                self.idle.emit(self.processed)
+        repository.conn.close()
+
+    def apply_batch(self, repository, batch):
+        # Tüm grup tek işlem ve tek fsync; hatalı iş sadece kendi savepoint'ini geri alır
+        conn = repository.conn
+        try:
+            conn.execute("BEGIN")
+            for method, args in TaskRepository.merge_calls(batch):
+                conn.execute("SAVEPOINT job")
+                try:
+                    getattr(repository, method)(*args)
+                    conn.execute("RELEASE job")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    self.failed.emit(method, str(e))
+            repository.bump_board_version()
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self.failed.emit("COMMIT", str(e))
+        self.processed += len(batch)
+
+class SearchWorker(QThread):
+    """Arama ve süzgeç sorgularını kendi okuma bağlantısıyla arka planda yapar; sadece en son istek işlenir."""
+    # İstek numarası ve {kategori: (görevler, devamı var mı)} sözlüğü
+    found = pyqtSignal(int, object)
+
+    def __init__(self, db_path, parent=None):
         super().__init__(parent)
-        self.setViewMode(QListWidget.ListMode)
-        self.setFlow(QListWidget.TopToBottom)
+        self.db_path = db_path
+        self.requests = queue.Queue()
+
+    def search(self, request_id, task_filter, sort_modes):
+        # sort_modes: {kategori: sıralama kipi}; sadece bu sütunlar sorgulanır
+        self.requests.put((request_id, task_filter, sort_modes))
+
+    def stop(self):
+        if self.isRunning():
+            self.requests.put(None)
+            self.wait()
+
+    def run(self):
+        repository = TaskRepository.open(self.db_path)
+        while True:
+            request = self.requests.get()
+            # Yazarken biriken eski istekleri atla
+            while request is not None and not self.requests.empty():
+                request = self.requests.get()
+            if request is None:
+                break
+            request_id, task_filter, sort_modes = request
+            try:
+                columns = repository.filter_columns(task_filter, sort_modes,
+                                                    TaskListModel.PAGE_SIZE)
+            except sqlite3.Error as e:
+                print(f"Arama hatası: {e}")
+                continue
+            self.found.emit(request_id, columns)
+        repository.conn.close()
+
+# Öncelik -> (açık renk, gradyan, kenarlık); (öncelik, koyu tema) anahtarlı
+CARD_COLORS = {
+    (HIGH, False): ("#FFF5F5", "#FED7D7", "#FEB2B2"),
+    (HIGH, True): ("#9B2C2C", "#C53030", "#FC8181"),
+    (MEDIUM, False): ("#FFFAF0", "#FEEBC8", "#FBD38D"),
+    (MEDIUM, True): ("#975A16", "#B7791F", "#F6AD55"),
+    (LOW, False): ("#F0FFF4", "#C6F6D5", "#9AE6B4"),
+    (LOW, True): ("#276749", "#2F855A", "#68D391"),
+}
+
+class CardStyle:
+    """Bir (öncelik, tema) çifti için paylaşılan boyama nesneleri."""
+    __slots__ = ("brush", "pen", "selected_pen", "text_pen")
+
+    def __init__(self, priority, dark):
+        color, gradient_color, border = CARD_COLORS.get(
+            (priority, dark), CARD_COLORS[(LOW, dark)])
+        # Nesne sınırlarına göre gradyan: aynı fırça her kart boyutunda kullanılabilir
+        gradient = QLinearGradient(0, 0, 1, 1)
+        gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        gradient.setColorAt(0, QColor(color))
+        gradient.setColorAt(1, QColor(gradient_color))
+        self.brush = QBrush(gradient)
+        self.pen = QPen(QColor(border), 2)
+        self.selected_pen = QPen(QColor("#4299e1"), 2)
+        self.text_pen = QPen(QColor("#ffffff" if dark else "#1a202c"))
+
+_card_styles = {}
+
+def card_style(priority, dark):
+    # Stiller ilk kullanımda bir kez oluşturulur
+    key = (priority, dark)
+    style = _card_styles.get(key)
+    if style is None:
+        style = _card_styles[key] = CardStyle(priority, dark)
+    return style
+
+def format_due_date(due_date):
+    # Tarihi kısalt
+    return QDate.fromString(due_date, "yyyy-MM-dd").toString("dd.MM.yy")
+
+# Tema renkleri; uygulama stil sayfası bu değerlerle derlenir
+THEME_COLORS = {
+    "light": {
+        "window_start": "#f7fafc", "window_end": "#edf2f7",
+        "text": "#2d3748", "heading": "#1a202c",
+        "field_bg": "white", "field_border": "#e2e8f0",
+        "field_hover_bg": "#f7fafc", "field_hover_border": "#cbd5e0",
+        "popup_hover": "#edf2f7",
+        "list_start": "#f8fafc", "list_end": "#edf2f7", "list_border": "#e2e8f0",
+        "list_text": "#2d3748",
+        "dialog_bg": "white", "dialog_text": "#2d3748", "dialog_heading": "#1a202c",
+        "dialog_button": "#3182ce", "dialog_button_hover": "#2c5282",
+        "link_bg": "#edf2f7", "scroll_track": "#e2e8f0", "scroll_handle": "#cbd5e0",
+        "calendar_border": "#e2e8f0", "calendar_hover": "#edf2f7",
+        "calendar_nav": "#f7fafc", "calendar_disabled": "#cbd5e0",
+    },
+    "dark": {
+        "window_start": "#1a202c", "window_end": "#2d3748",
+        "text": "white", "heading": "white",
+        "field_bg": "#2d3748", "field_border": "#4a5568",
+        "field_hover_bg": "#4a5568", "field_hover_border": "#718096",
+        "popup_hover": "#4a5568",
+        "list_start": "#2d3748", "list_end": "#1a202c", "list_border": "#4a5568",
+        "list_text": "#ffffff",
+        "dialog_bg": "#2d3748", "dialog_text": "white", "dialog_heading": "white",
+        "dialog_button": "#4299e1", "dialog_button_hover": "#3182ce",
+        "link_bg": "#4a5568", "scroll_track": "#4a5568", "scroll_handle": "#718096",
+        "calendar_border": "#4a5568", "calendar_hover": "#4a5568",
+        "calendar_nav": "#1a202c", "calendar_disabled": "#4a5568",
+    },
+}
+
+# Ana pencere ve altındaki her şey için tek stil sayfası; kurallar #mainWindow ile
+# sınırlandırılır, böylece ebeveynsiz mesaj kutuları ve tepsi menüsü etkilenmez.
+APP_STYLESHEET = Template("""
+    QMainWindow#mainWindow, #mainWindow QWidget {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 ${window_start}, stop:1 ${window_end});
+    }
+    #mainWindow QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 #4299e1, stop:1 #3182ce);
+        color: white;
+        border: none;
+        padding: 12px;
+        border-radius: 8px;
+    }
+    #mainWindow QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 #3182ce, stop:1 #2c5282);
+    }
+    #mainWindow QPushButton#dateButton {
+        background: ${field_bg};
+        border: 2px solid ${field_border};
+        color: ${text};
+        padding: 8px 16px;
+        text-align: left;
+        font-weight: normal;
+    }
+    #mainWindow QPushButton#dateButton:hover {
+        background: ${field_hover_bg};
+        border: 2px solid ${field_hover_border};
+    }
+    #mainWindow QPushButton#filterButton {
+        background: ${field_bg};
+        border: 2px solid ${field_border};
+        color: ${text};
+        padding: 6px 14px;
+        font-weight: normal;
+    }
+    #mainWindow QPushButton#filterButton:hover {
+        background: ${field_hover_bg};
+        border: 2px solid ${field_hover_border};
+    }
+    #mainWindow QPushButton#filterButton:checked {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 #4299e1, stop:1 #3182ce);
+        border: 2px solid #3182ce;
+        color: white;
+    }
+    #mainWindow QPushButton#closeButton {
+        background: transparent;
+        border: none;
+        color: ${heading};
+        padding: 0px;
+    }
+    #mainWindow QPushButton#closeButton:hover {
+        background: transparent;
+        color: #e53e3e;
+    }
+    #mainWindow QLineEdit {
+        background-color: ${field_bg};
+        color: ${text};
+        border: 2px solid ${field_border};
+        padding: 8px 12px;
+        border-radius: 8px;
+        min-height: 20px;
+    }
+    #mainWindow QComboBox {
+        background-color: ${field_bg};
+        color: ${text};
+        border: 2px solid ${field_border};
+        border-radius: 8px;
+        padding: 4px 8px;
+        min-height: 20px;
+        margin: 0px;
+    }
+    #mainWindow QComboBox::drop-down {
+        border: none;
+        padding-right: 8px;
+    }
+    #mainWindow QComboBox::down-arrow {
+        image: none;
+        width: 0px;
+        height: 0px;
+    }
+    #mainWindow QComboBox QAbstractItemView {
+        background-color: ${field_bg};
+        color: ${text};
+        selection-background-color: #4299e1;
+        border: 2px solid ${field_border};
+        border-radius: 8px;
+        padding: 4px;
+        outline: none;
+    }
+    #mainWindow QComboBox QAbstractItemView::item {
+        padding: 4px 8px;
+        min-height: 20px;
+        border: none;
+    }
+    #mainWindow QComboBox QAbstractItemView::item:hover {
+        background-color: ${popup_hover};
+    }
+    #mainWindow QComboBox QAbstractItemView::item:selected {
+        background-color: #4299e1;
+        color: white;
+    }
+    #mainWindow QCalendarWidget {
+        background-color: ${field_bg};
+        color: ${text};
+        selection-background-color: #4299e1;
+    }
+    #mainWindow QLabel {
+        color: ${text};
+        font-size: 14px;
+        background: transparent;
+    }
+    #mainWindow QLabel#appTitle {
+        color: ${heading};
+    }
+    #mainWindow QLabel#versionLabel {
+        color: ${heading};
+        padding-top: 5px;
+    }
+    #mainWindow QListView#taskList {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                  stop:0 ${list_start}, stop:1 ${list_end});
+        border: 2px solid ${list_border};
+        border-radius: 12px;
+        padding: 15px;
+        color: ${list_text};
+    }
+    #mainWindow QListView#taskList::item,
+    #mainWindow QListView#taskList::item:selected,
+    #mainWindow QListView#taskList::item:hover {
+        background: transparent;
+        border: none;
+        outline: none;
+    }
+    #mainWindow QListView#taskList QMenu {
+        background-color: ${list_start};
+        color: ${list_text};
+        border: 1px solid ${list_border};
+        border-radius: 8px;
+        padding: 5px;
+    }
+    #mainWindow QListView#taskList QMenu::item {
+        padding: 8px 25px;
+        border-radius: 4px;
+    }
+    #mainWindow QListView#taskList QMenu::item:selected {
+        background-color: rgba(49, 130, 206, 0.1);
+    }
+    #mainWindow QListView#taskList QMenu::separator {
+        height: 1px;
+        background-color: ${list_border};
+        margin: 5px 0px;
+    }
+""")
+
+# Diyalog ve takvim stilleri; tema değiştiğinde bir kez derlenip sadece açılan pencereye uygulanır
+EDIT_DIALOG_STYLESHEET = Template("""
+    QDialog {
+        background-color: ${dialog_bg};
+        border-radius: 8px;
+    }
+    QLabel {
+        color: ${dialog_text};
+        font-size: 12px;
+    }
+""")
+
+INFO_DIALOG_STYLESHEET = Template("""
+    QDialog {
+        background-color: ${dialog_bg};
+        border-radius: 8px;
+    }
+    QLabel {
+        color: ${dialog_text};
+        font-size: 13px;
+        padding: 5px;
+        line-height: 1.6;
+    }
+    QPushButton {
+        background-color: ${dialog_button};
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: ${dialog_button_hover};
+    }
+    QWidget#linkWidget {
+        background-color: ${link_bg};
+        border-radius: 8px;
+        padding: 15px;
+        margin: 10px;
+    }
+    QScrollArea {
+        border: none;
+        background: transparent;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: ${scroll_track};
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: ${scroll_handle};
+        border-radius: 6px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+""")
+
+PALETTE_STYLESHEET = Template("""
+    QDialog#taskPalette {
+        background-color: ${dialog_bg};
+        border: 2px solid ${field_border};
+        border-radius: 12px;
+    }
+    QLineEdit {
+        background-color: ${field_bg};
+        color: ${text};
+        border: 2px solid ${field_border};
+        padding: 8px 12px;
+        border-radius: 8px;
+        font-size: 14px;
+    }
+    QListWidget {
+        background-color: ${dialog_bg};
+        color: ${dialog_text};
+        border: none;
+        outline: none;
+        font-size: 13px;
+    }
+    QListWidget::item {
+        padding: 6px 8px;
+        border-radius: 6px;
+    }
+    QListWidget::item:selected {
+        background-color: ${dialog_button};
+        color: white;
+    }
+""")
+
+CALENDAR_STYLESHEET = Template("""
+    QCalendarWidget {
+        background-color: ${dialog_bg};
+        border: 2px solid ${calendar_border};
+        border-radius: 12px;
+    }
+    QCalendarWidget QToolButton {
+        color: ${dialog_text};
+        background-color: transparent;
+        padding: 8px;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QCalendarWidget QToolButton:hover {
+        background-color: ${calendar_hover};
+    }
+    QCalendarWidget QMenu {
+        background-color: ${dialog_bg};
+        color: ${dialog_text};
+        border: 1px solid ${calendar_border};
+        border-radius: 4px;
+    }
+    QCalendarWidget QSpinBox {
+        color: ${dialog_text};
+        background-color: ${dialog_bg};
+        selection-background-color: #4299e1;
+        selection-color: white;
+        border: 1px solid ${calendar_border};
+        border-radius: 4px;
+        padding: 2px;
+    }
+    QCalendarWidget QTableView {
+        background-color: ${dialog_bg};
+        selection-background-color: #4299e1;
+        selection-color: white;
+        outline: none;
+    }
+    QCalendarWidget QAbstractItemView:enabled {
+        color: ${dialog_text};
+        background-color: ${dialog_bg};
+        selection-background-color: #4299e1;
+        selection-color: white;
+    }
+    QCalendarWidget QWidget#qt_calendar_navigationbar {
+        background-color: ${calendar_nav};
+        border-top-left-radius: 12px;
+        border-top-right-radius: 12px;
+        padding: 4px;
+    }
+    QCalendarWidget QWidget#qt_calendar_prevmonth,
+    QCalendarWidget QWidget#qt_calendar_nextmonth {
+        color: ${dialog_text};
+        qproperty-icon: none;
+        min-width: 32px;
+        max-width: 32px;
+        min-height: 32px;
+        max-height: 32px;
+    }
+    QCalendarWidget QWidget#qt_calendar_prevmonth {
+        qproperty-text: "◀";
+    }
+    QCalendarWidget QWidget#qt_calendar_nextmonth {
+        qproperty-text: "▶";
+    }
+    QCalendarWidget QWidget {
+        alternate-background-color: ${dialog_bg};
+    }
+    QCalendarWidget QAbstractItemView:disabled {
+        color: ${calendar_disabled};
+    }
+""")
+
+# Yardım metni de tema renkleriyle derlenir
+HELP_TEXT = Template("""
+        <div style='margin: 20px;'>
+            <h2 style='color: ${dialog_heading}; font-size: 24px; margin-bottom: 20px;'>
+                🎯 Ta-Du Kullanım Kılavuzu
+            </h2>
+            
+            <h3 style='color: ${dialog_text}; font-size: 18px; margin-top: 25px;'>
+                📝 Görev Ekleme ve Düzenleme
+            </h3>
+            <p style='margin-left: 20px; line-height: 1.8;'>
+                • Üst kısımdaki görev giriş alanına görev başlığını yazın<br>
+                • Öncelik seçin: Düşük 🟢, Orta 🟡, Yüksek 🔴<br>
+                • Kategori seçin: Yapılacak, Yapılıyor, Bitti, Dilek Listesi<br>
+                • Tarih seçin: Görevin tamamlanması gereken tarihi belirleyin<br>
+                • "➕ Ekle" butonuna tıklayın veya Enter tuşuna basın<br>
+                • 🔍 Ara kutusuna yazdıkça tüm sütunlarda sadece başlığı eşleşen görevler gösterilir<br>
+                • 🎚️ Süzgeç çubuğu ile görevleri önceliğe, tarih aralığına, gecikenlere veya bu haftaya
+                göre süzün; seçimler arama ile birlikte uygulanır, ✖ Temizle hepsini kaldırır<br>
+                • Sütun başlığındaki seçiciden sütunu elle, öncelik, bitiş tarihi veya en yeni sırasına göre
+                dizin; seçiminiz her sütun için ayrı hatırlanır
+            </p>
+            
+            <h3 style='color: ${dialog_text}; font-size: 18px; margin-top: 25px;'>
+                ⌨️ Klavye Kısayolları
+            </h3>
+            <p style='margin-left: 20px; line-height: 1.8;'>
+                • <b>E tuşu:</b> Seçili görevi düzenleme penceresini açar<br>
+                • <b>Delete tuşu:</b> Seçili görevleri silmek için onay penceresi açar<br>
+                • <b>Shift + Sağ Ok:</b> Seçili görevleri bir sonraki kategoriye taşır<br>
+                &nbsp;&nbsp;&nbsp;(Yapılacak → Yapılıyor → Bitti → Dilek Listesi)<br>
+                • <b>Shift + Sol Ok:</b> Seçili görevleri bir önceki kategoriye taşır<br>
+                &nbsp;&nbsp;&nbsp;(Dilek Listesi → Bitti → Yapılıyor → Yapılacak)<br>
+                • <b>Ctrl + Yukarı/Aşağı Ok:</b> Görevi sütun içinde yukarı/aşağı kaydırır (elle sıralı sütunlarda)<br>
+                • <b>Ctrl + Z / Ctrl + Y:</b> Son işlemi geri alır / yineler<br>
+                • <b>Ctrl + K:</b> Hızlı geçiş paletini açar; başlığı yazıp Enter ile karta gider<br>
+                • <b>Alt + Tab:</b> Uygulamayı simge durumuna küçültür
+            </p>
+            
+            <h3 style='color: ${dialog_text}; font-size: 18px; margin-top: 25px;'>
+                🖱️ Fare İşlemleri
+            </h3>
+            <p style='margin-left: 20px; line-height: 1.8;'>
+                • <b>Sağ Tık Menüsü:</b><br>
+                &nbsp;&nbsp;&nbsp;✏️ Düzenle: Görevi düzenleme penceresini açar<br>
+                &nbsp;&nbsp;&nbsp;🗑️ Sil: Seçili görevleri silmek için onay penceresi açar<br>
+                &nbsp;&nbsp;&nbsp;📦 Taşı: Seçili görevleri başka bir kategoriye taşır<br>
+                &nbsp;&nbsp;&nbsp;⚡ Öncelik: Seçili görevlerin önceliğini değiştirir<br>
+                • <b>Ctrl/Shift + Tık:</b> Birden fazla görev seçer<br>
+                • <b>Sürükle-Bırak:</b> Görevleri kategoriler arasında taşıyabilir, sütun içinde sıralayabilirsiniz<br>
+                • <b>Sistem Tray İkonu:</b><br>
+                &nbsp;&nbsp;&nbsp;➜ Çift tıklama: Uygulamayı tam ekran açar<br>
+                &nbsp;&nbsp;&nbsp;➜ Sağ tık: Göster ve Çıkış seçeneklerini gösterir
+            </p>
+            
+            <h3 style='color: ${dialog_text}; font-size: 18px; margin-top: 25px;'>
+                📋 Kategoriler
+            </h3>
+            <p style='margin-left: 20px; line-height: 1.8;'>
+                • <b>📋 Yapılacak:</b> Henüz başlanmamış görevler<br>
+                • <b>🔄 Yapılıyor:</b> Üzerinde çalışılan görevler<br>
+                • <b>✅ Bitti:</b> Tamamlanan görevler<br>
+                • <b>⭐ Dilek Listesi:</b> İleride yapılması planlanan görevler
+            </p>
+            
+            <h3 style='color: ${dialog_text}; font-size: 18px; margin-top: 25px;'>
+                🎨 Özelleştirme ve Görünüm
+            </h3>
+            <p style='margin-left: 20px; line-height: 1.8;'>
+                • <b>Tema Değiştirme:</b><br>
+                &nbsp;&nbsp;&nbsp;➜ 🎨 Tema Değiştir butonu ile açık/koyu tema arasında geçiş yapın<br>
+                • <b>Öncelik Renkleri:</b><br>
+                &nbsp;&nbsp;&nbsp;➜ Yüksek: 🔴 Kırmızı tonları<br>
+                &nbsp;&nbsp;&nbsp;➜ Orta: 🟡 Turuncu tonları<br>
+                &nbsp;&nbsp;&nbsp;➜ Düşük: 🟢 Yeşil tonları
+            </p>
+            
+            <h3 style='color: ${dialog_text}; font-size: 18px; margin-top: 25px;'>
+                💡 İpuçları
+            </h3>
+            <p style='margin-left: 20px; line-height: 1.8;'>
+                • Kapatma (✖) butonuna tıkladığınızda uygulama sistem tepsisine küçülür<br>
+                • Görevlerinizi önceliklerine göre renklendirerek önem derecesini belirleyin<br>
+                • Tarihi geçmiş görevler için tarih kısmı kırmızı ile vurgulanır<br>
+                • Görevleri sürükleyerek kategoriler arasında hızlıca taşıyabilir, sütun içinde sıralayabilirsiniz<br>
+                • Sistem tepsisindeki simgeye çift tıklayarak uygulamayı tekrar açabilirsiniz
+            </p>
+        </div>
+""")
+
+# İsim -> şablon; ThemeEngine her (şablon, tema) çiftini bir kez derler
+THEME_TEMPLATES = {
+    "app": APP_STYLESHEET,
+    "edit_dialog": EDIT_DIALOG_STYLESHEET,
+    "info_dialog": INFO_DIALOG_STYLESHEET,
+    "calendar": CALENDAR_STYLESHEET,
+    "palette": PALETTE_STYLESHEET,
+    "help_text": HELP_TEXT,
+}
+
+class ThemeEngine:
+    """Her tema için stil sayfalarını bir kez derler ve önbellekte tutar.
+
+    Tema değişimi uygulamanın stil sayfasını değiştiren tek bir setStyleSheet
+    çağrısıdır; kart sayısından bağımsızdır. Diyaloglar bir sonraki açılışlarında,
+    sadece tema değiştiyse yeniden stillenir; son uygulanan tema widget'ın "theme"
+    özelliğinde tutulur.
+    """
+
+    def __init__(self):
+        self._compiled = {}
+
+    def stylesheet(self, theme, name="app"):
+        key = (name, theme)
+        if key not in self._compiled:
+            self._compiled[key] = THEME_TEMPLATES[name].substitute(THEME_COLORS[theme])
+        return self._compiled[key]
+
+    def apply(self, theme):
+        QApplication.instance().setStyleSheet(self.stylesheet(theme))
+
+    def style(self, widget, name, theme):
+        # Widget'ın teması değişmediyse hiçbir şey yapma; değiştiyse True döner
+        if widget.property("theme") == theme:
+            return False
+        widget.setStyleSheet(self.stylesheet(theme, name))
+        widget.setProperty("theme", theme)
+        return True
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """Görev kartlarını widget oluşturmadan doğrudan boyar."""
+    CARD_WIDTH = 320
+    MIN_CARD_WIDTH = 200
+    MIN_HEIGHT = 80
+    # Kart kenar boşluğu + etiket dolgusu
+    PADDING = 11
+    SPACING = 10
+    # Kart görüntüleri için QPixmapCache sınırı (KB)
+    PIXMAP_CACHE_KB = 32 * 1024
+    # Ölçülmüş başlık yüksekliği sayısı; dolunca önbellek sıfırlanır
+    TEXT_CACHE_SIZE = 20000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dark_mode = False
+        self.title_font = QFont("Segoe UI", 10, QFont.Bold)
+        self.meta_font = QFont("Segoe UI", 9, QFont.Bold)
+        self.card_width = self.CARD_WIDTH
+        # (başlık, yazı tipi, genişlik) -> satır kaydırılmış başlık yüksekliği
+        self._title_heights = {}
+        self._title_font_key = self.title_font.key()
+        self._meta_height = QFontMetrics(self.meta_font).height()
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_KB)
+
+    def set_available_width(self, width):
+        # Kart genişliği sütuna sığacak şekilde daralır; değiştiyse True döner
+        card_width = max(self.MIN_CARD_WIDTH, min(self.CARD_WIDTH, width))
+        if card_width == self.card_width:
+            return False
+        self.card_width = card_width
+        return True
+
+    def title_height(self, title):
+        # Tema yüksekliği etkilemez; aynı başlık, yazı tipi ve genişlik yeniden ölçülmez
+        width = self.card_width - 2 * self.PADDING
+        key = (title, self._title_font_key, width)
+        height = self._title_heights.get(key)
+        if height is None:
+            if len(self._title_heights) >= self.TEXT_CACHE_SIZE:
+                self._title_heights.clear()
+            metrics = QFontMetrics(self.title_font)
+            height = metrics.boundingRect(0, 0, width, 100000,
+                                          Qt.AlignHCenter | Qt.TextWordWrap, title).height()
+            self._title_heights[key] = height
+        return height
+
+    def meta_height(self):
+        return self._meta_height
+
+    def card_height(self, title):
+        content = self.title_height(title) + self.SPACING + self.meta_height()
+        return max(self.MIN_HEIGHT, content + 2 * self.PADDING)
+
+    def sizeHint(self, option, index):
+        task = index.data(TaskListModel.TaskRole)
+        if task is None:
+            return QSize(self.card_width, self.MIN_HEIGHT)
+        return QSize(self.card_width, self.card_height(task.title))
+
+    def paint(self, painter, option, index):
+        task = index.data(TaskListModel.TaskRole)
+        if task is None:
+            return
+        selected = bool(option.state & QStyle.State_Selected)
+        size = QSize(self.card_width, option.rect.height())
+        ratio = painter.device().devicePixelRatioF()
+        
+        # Değişmemiş kart önbellekten tek bir kopyalama ile çizilir
+        key = (f"card:{int(self.dark_mode)}{int(selected)}:{size.width()}x{size.height()}@{ratio}:"
+               f"{task.priority}:{task.due_date}:{task.title}")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self.render_card(task, size, selected, ratio)
+            QPixmapCache.insert(key, pixmap)
+        
+        # Kartı satırın ortasına yerleştir
+        painter.drawPixmap(option.rect.center().x() - self.card_width // 2,
+                           option.rect.top(), pixmap)
+
+    def render_card(self, task, size, selected, ratio=1.0):
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        style = card_style(task.priority, self.dark_mode)
+        rect = QRect(QPoint(0, 0), size)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(style.selected_pen if selected else style.pen)
+        painter.setBrush(style.brush)
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 8, 8)
+        
+        # İçeriği dikeyde ortala
+        title_height = self.title_height(task.title)
+        meta_height = self.meta_height()
+        content_height = title_height + self.SPACING + meta_height
+        top = (rect.height() - content_height) // 2
+        text_width = rect.width() - 2 * self.PADDING
+        left = self.PADDING
+        
+        painter.setPen(style.text_pen)
+        painter.setFont(self.title_font)
+        painter.drawText(QRect(left, top, text_width, title_height),
+                         Qt.AlignHCenter | Qt.TextWordWrap, task.title)
+        
+        painter.setFont(self.meta_font)
+        meta_text = f"⚡ {PRIORITIES[task.priority]}    📅 {format_due_date(task.due_date)}"
+        painter.drawText(QRect(left, top + title_height + self.SPACING, text_width, meta_height),
+                         Qt.AlignHCenter, meta_text)
+        painter.end()
+        return pixmap
+
+class TaskList(QListView):
+    def __init__(self, category, store, fetch_page=None, resolve_rows=None, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.ListMode)
+        self.setFlow(QListView.TopToBottom)
         self.setSpacing(10)
         self.setWrapping(False)
         self.setMinimumWidth(350)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.title = title
+        # Sütunun kategori kodu
+        self.category = category
+        self.setObjectName("taskList")
+        
+        # Model ve kart boyayıcı; sadece görünen satırlar boyanır
+        self.task_model = TaskListModel(category, store, fetch_page, resolve_rows, self)
+        self.card_delegate = TaskCardDelegate(self)
+        self.setModel(self.task_model)
+        self.setItemDelegate(self.card_delegate)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        # Ctrl/Shift ile çoklu seçim; toplu işlemler seçili kartların hepsine uygulanır
+        self.setSelectionMode(QListView.ExtendedSelection)
         self.updateStyle()
         
+        # Sütunlar arası ve sütun içi sürükle-bırak; taşımayı pencere yapar, model değil
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDropIndicatorShown(True)
+        self.setDragDropMode(QListView.DragDrop)
+        self.setDefaultDropAction(Qt.MoveAction)
+        
         # Sağ tık menüsünü etkinleştir
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
         
         # İçeriği ortala
-        self.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        self.setHorizontalScrollMode(QListWidget.ScrollPerPixel)
-        
-        # Liste öğelerinin hizalamasını ayarla
-        self.setStyleSheet("""
-            QListWidget::item {
-                margin-left: 15px;
-                margin-right: 15px;
-            }
-        """)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QListView.ScrollPerPixel)
         
-    def delete_task(self, task_id):
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Genişlik değişirse satırları yeniden yerleştir; başlık yükseklikleri önbellekten gelir
+        if self.card_delegate.set_available_width(self.viewport().width() - 2 * self.spacing()):
+            self.scheduleDelayedItemsLayout()
+        
+    def startDrag(self, supported_actions):
+        # Sürükleme görüntüsü olarak kartın kendisi; veri olarak sadece görev id'si
+        index = self.currentIndex()
+        task = index.data(TaskListModel.TaskRole) if index.isValid() else None
+        if task is None:
+            return
+        rect = self.visualRect(index)
+        size = QSize(self.card_delegate.card_width, rect.height())
+        drag = QDrag(self)
+        drag.setMimeData(self.task_model.mimeData([index]))
+        drag.setPixmap(self.card_delegate.render_card(task, size, True, self.devicePixelRatioF()))
+        left = rect.center().x() - size.width() // 2
+        drag.setHotSpot(self.viewport().mapFromGlobal(QCursor.pos()) - QPoint(left, rect.top()))
+        drag.exec_(Qt.MoveAction)
+        
+    def accepts_drop(self, event):
+        # Sadece bu pencerenin sütunlarından gelen kartlar kabul edilir
+        return (isinstance(event.source(), TaskList) and event.source().window() is self.window()
+                and task_id_from_mime(event.mimeData()) is not None)
+        
+    def dragEnterEvent(self, event):
+        super().dragEnterEvent(event)
+        if self.accepts_drop(event):
+            event.setDropAction(Qt.MoveAction)
+            event.accept()
+        else:
+            event.ignore()
+            
+    def dragMoveEvent(self, event):
+        # Otomatik kaydırma ve bırakma göstergesi Qt'den gelir
+        super().dragMoveEvent(event)
+        if self.accepts_drop(event):
+            event.setDropAction(Qt.MoveAction)
+            event.accept()
+        else:
+            event.ignore()
+            
+    def dropEvent(self, event):
+        # Qt sürükleme durumunu ve otomatik kaydırmayı kapatır; model bırakılan veriyi işlemez
+        super().dropEvent(event)
+        if not self.accepts_drop(event):
+            event.ignore()
+            return
+        event.setDropAction(Qt.MoveAction)
+        event.accept()
+        task_id = task_id_from_mime(event.mimeData())
+        if self.window().drop_task(task_id, self.category, self.drop_row(event.pos())):
+            play_move_sound()
+            
+    def drop_row(self, pos):
+        # Bırakılan noktanın önüne geleceği satır; kart aralıklarında alttaki karta bakılır
+        index = self.indexAt(pos)
+        if index.isValid():
+            rect = self.visualRect(index)
+            return index.row() + (1 if pos.y() > rect.center().y() else 0)
+        index = self.indexAt(pos + QPoint(0, 2 * self.spacing()))
+        if index.isValid():
+            return index.row()
+        return self.task_model.rowCount()
+        
+    def current_task(self):
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(TaskListModel.TaskRole)
+        
+    def selected_task_ids(self):
+        # Seçili kartların id'leri liste sırasıyla; seçim yoksa geçerli kart
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        if rows:
+            return [self.task_model.task_at(row).id for row in rows]
+        task = self.current_task()
+        return [task.id] if task else []
+        
+    def delete_tasks(self, task_ids):
+        if not task_ids:
+            return False
         msg = QMessageBox()
         msg.setWindowTitle("Görevi Sil")
-        msg.setText("Bu görevi silmek istediğinizden emin misiniz?")
+        if len(task_ids) == 1:
+            msg.setText("Bu görevi silmek istediğinizden emin misiniz?")
+        else:
+            msg.setText(f"Seçili {len(task_ids)} görevi silmek istediğinizden emin misiniz?")
         msg.setIcon(QMessageBox.Question)
         msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         msg.setDefaultButton(QMessageBox.No)
@@ -223,166 +2575,291 @@ class TaskList(QListWidget):
         no_button.setText('Hayır')
         
         if msg.exec_() == QMessageBox.Yes:
-            window = self.window()
-            window.cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            window.conn.commit()
+            self.window().delete_tasks(task_ids)
             play_delete_sound()
             return True
         return False
 
     def show_context_menu(self, position):
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
+        task = index.data(TaskListModel.TaskRole)
+        # Seçim dışındaki karta sağ tıklanırsa sadece o kart seçilir
+        if not self.selectionModel().isSelected(index):
+            self.selectionModel().select(index, QItemSelectionModel.ClearAndSelect)
+        self.selectionModel().setCurrentIndex(index, QItemSelectionModel.NoUpdate)
+        task_ids = self.selected_task_ids()
             
         menu = QMenu(self)
         edit_action = menu.addAction("✏️ Düzenle")
-        delete_action = menu.addAction("🗑️ Sil")
+        edit_action.setEnabled(len(task_ids) == 1)
+        delete_action = menu.addAction("🗑️ Sil" if len(task_ids) == 1 else f"🗑️ Sil ({len(task_ids)})")
         menu.addSeparator()
         
         # Taşıma menüsü
         move_menu = QMenu("📦 Taşı", menu)
-        categories = ["Yapılacak", "Yapılıyor", "Bitti", "Dilek Listesi"]
         move_actions = {}
         
-        for category in categories:
-            if category != self.title:  # Mevcut kategoriyi hariç tut
-                action = move_menu.addAction(category)
+        for category, name in enumerate(CATEGORIES):
+            if category != self.category:  # Mevcut kategoriyi hariç tut
+                action = move_menu.addAction(name)
                 move_actions[action] = category
                 
         menu.addMenu(move_menu)
         
+        # Öncelik menüsü
+        priority_menu = QMenu("⚡ Öncelik", menu)
+        priority_actions = {}
+        for priority, name in enumerate(PRIORITIES):
+            priority_actions[priority_menu.addAction(name)] = priority
+        menu.addMenu(priority_menu)
+        
         # Menüyü göster ve seçilen aksiyonu al
         action = menu.exec_(self.mapToGlobal(position))
         
         if not action:
             return
             
-        current_widget = self.itemWidget(item)
-        
         if action == edit_action:
             # Görevi düzenle
             window = self.window()
-            window.edit_task(current_widget)
+            window.edit_task(task)
             play_add_sound()
         elif action == delete_action:
-            # Görevi sil (onay ile)
-            if self.delete_task(current_widget.task_id):
-                self.takeItem(self.row(item))
+            # Seçili görevleri sil (onay ile)
+            self.delete_tasks(task_ids)
         elif action in move_actions:
-            # Görevi taşı
+            # Seçili görevleri taşı
             new_category = move_actions[action]
             window = self.window()
-            window.update_task_category(current_widget.task_id, new_category)
+            window.move_tasks(task_ids, new_category)
             play_move_sound()
-            window.load_tasks()  # Listeleri yenile
+        elif action in priority_actions:
+            self.window().set_tasks_priority(task_ids, priority_actions[action])
         
     def updateStyle(self, dark=False):
-        if dark:
-            bg_start = "#2d3748"
-            bg_end = "#1a202c"
-            border = "#4a5568"
-            text = "#ffffff"
-        else:
-            bg_start = "#f8fafc"
-            bg_end = "#edf2f7"
-            border = "#e2e8f0"
-            text = "#2d3748"
-            
-        self.setStyleSheet(f"""
-            QListWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 {bg_start}, stop:1 {bg_end});
-                border: 2px solid {border};
-                border-radius: 12px;
-                padding: 15px;
-                color: {text};
-            }}
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                margin-left: 15px;
-                margin-right: 15px;
-            }}
-            QListWidget::item:selected {{
-                background: transparent;
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:hover {{
-                background: transparent;
-                border: none;
-                outline: none;
-            }}
-            QMenu {{
-                background-color: {bg_start};
-                color: {text};
-                border: 1px solid {border};
-                border-radius: 8px;
-                padding: 5px;
-            }}
-            QMenu::item {{
-                padding: 8px 25px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: rgba(49, 130, 206, 0.1);
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {border};
-                margin: 5px 0px;
-            }}
-        """)
+        # Liste görünümü uygulama stil sayfasından gelir; kartlar temayı boyayıcıdan alır
+        if self.card_delegate.dark_mode != dark:
+            self.card_delegate.dark_mode = dark
+            self.viewport().update()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Delete:
-            current_item = self.currentItem()
-            if current_item:
-                current_widget = self.itemWidget(current_item)
-                if current_widget:
-                    # Görevi sil (onay ile)
-                    if self.delete_task(current_widget.task_id):
-                        self.takeItem(self.row(current_item))
+            # Seçili görevleri sil (onay ile)
+            self.delete_tasks(self.selected_task_ids())
         elif event.key() == Qt.Key_E:  # E tuşuna basıldığında
-            current_item = self.currentItem()
-            if current_item:
-                current_widget = self.itemWidget(current_item)
-                if current_widget:
-                    # Görevi düzenle
-                    window = self.window()
-                    window.edit_task(current_widget)
-                    play_add_sound()
+            task = self.current_task()
+            if task:
+                # Görevi düzenle
+                window = self.window()
+                window.edit_task(task)
+                play_add_sound()
         # Shift + Sağ/Sol ok tuşları için kontrol
-        elif event.modifiers() == Qt.ShiftModifier:
-            current_item = self.currentItem()
-            if current_item:
-                current_widget = self.itemWidget(current_item)
-                if current_widget:
-                    categories = ["Yapılacak", "Yapılıyor", "Bitti", "Dilek Listesi"]
-                    current_index = categories.index(current_widget.category)
-                    
-                    if event.key() == Qt.Key_Right and current_index < len(categories) - 1:
-                        # Sağa taşı
-                        new_category = categories[current_index + 1]
-                        window = self.window()
-                        window.update_task_category(current_widget.task_id, new_category)
-                        play_move_sound()
-                        window.load_tasks()
-                    elif event.key() == Qt.Key_Left and current_index > 0:
-                        # Sola taşı
-                        new_category = categories[current_index - 1]
-                        window = self.window()
-                        window.update_task_category(current_widget.task_id, new_category)
-                        play_move_sound()
-                        window.load_tasks()
+        elif event.modifiers() == Qt.ShiftModifier and event.key() in (Qt.Key_Right, Qt.Key_Left):
+            task_ids = self.selected_task_ids()
+            if task_ids:
+                if event.key() == Qt.Key_Right and self.category < len(CATEGORIES) - 1:
+                    # Seçili görevleri sağa taşı
+                    new_category = self.category + 1
+                    window = self.window()
+                    window.move_tasks(task_ids, new_category)
+                    play_move_sound()
+                elif event.key() == Qt.Key_Left and self.category > 0:
+                    # Seçili görevleri sola taşı
+                    new_category = self.category - 1
+                    window = self.window()
+                    window.move_tasks(task_ids, new_category)
+                    play_move_sound()
+        # Ctrl + Yukarı/Aşağı: kartı sütun içinde bir sıra kaydır
+        elif event.modifiers() == Qt.ControlModifier and event.key() in (Qt.Key_Up, Qt.Key_Down):
+            task = self.current_task()
+            if task and self.window().reorder_task(task.id, -1 if event.key() == Qt.Key_Up else 1):
+                play_move_sound()
+        # Ctrl + Z / Ctrl + Y: son işlemi geri al / yinele
+        elif event.matches(QKeySequence.Undo):
+            self.window().undo()
+        elif event.matches(QKeySequence.Redo) or (
+                event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_Y):
+            self.window().redo()
         else:
             super().keyPressEvent(event)
 
+class TaskEditDialog(QDialog):
+    """Görev düzenleme penceresi; bir kez oluşturulur, her açılışta görevle yeniden doldurulur."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Görevi Düzenle")
+        self.setMinimumWidth(400)
+        self.task = None
+        self.selected_date = QDate.currentDate()
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+        
+        # Başlık düzenleme
+        title_label = QLabel("📝 Görev Başlığı:")
+        self.title_input = QLineEdit()
+        self.title_input.setFont(QFont("Segoe UI", 11))
+        
+        # Öncelik düzenleme
+        priority_label = QLabel("🎯 Öncelik:")
+        self.priority_combo = QComboBox()
+        self.priority_combo.addItems(PRIORITIES)
+        self.priority_combo.setFont(QFont("Segoe UI", 11))
+        
+        # Kategori düzenleme
+        category_label = QLabel("📋 Kategori:")
+        self.category_combo = QComboBox()
+        self.category_combo.addItems(CATEGORIES)
+        self.category_combo.setFont(QFont("Segoe UI", 11))
+        
+        # Tarih düzenleme
+        date_label = QLabel("📅 Tarih:")
+        self.date_button = QPushButton()
+        self.date_button.setObjectName("dateButton")  # Tema stil sayfasındaki tarih düğmesi kuralı
+        self.date_button.setFont(QFont("Segoe UI", 11))
+        self.date_button.setCursor(Qt.PointingHandCursor)
+        self.date_button.clicked.connect(self.choose_date)
+        
+        # Butonlar
+        button_layout = QHBoxLayout()
+        save_button = QPushButton("💾 Kaydet")
+        cancel_button = QPushButton("❌ İptal")
+        
+        for button in [save_button, cancel_button]:
+            button.setFont(QFont("Segoe UI", 11))
+            button.setCursor(Qt.PointingHandCursor)
+            button_layout.addWidget(button)
+        
+        save_button.clicked.connect(self.accept)
+        cancel_button.clicked.connect(self.reject)
+        
+        # Widget'ları düzene ekle
+        for widget in [
+            title_label, self.title_input,
+            priority_label, self.priority_combo,
+            category_label, self.category_combo,
+            date_label, self.date_button
+        ]:
+            layout.addWidget(widget)
+        
+        layout.addLayout(button_layout)
+
+    def set_task(self, task):
+        self.task = task
+        self.title_input.setText(task.title)
+        # Seçicilerin sırası kod sırasıdır
+        self.priority_combo.setCurrentIndex(task.priority)
+        self.category_combo.setCurrentIndex(task.category)
+        self.set_date(QDate.fromString(task.due_date, "yyyy-MM-dd"))
+        self.title_input.setFocus()
+
+    def set_date(self, date):
+        self.selected_date = date
+        self.date_button.setText(f"📅 {date.toString('dd.MM.yy')}")
+
+    def choose_date(self):
+        self.parent().open_calendar(self.date_button, self.selected_date, self.set_date)
+
+    def edited_task(self):
+        return self.task.replace(
+            title=self.title_input.text(),
+            category=self.category_combo.currentIndex(),
+            priority=self.priority_combo.currentIndex(),
+            due_date=self.selected_date.toString("yyyy-MM-dd")
+        )
+
+class TaskPalette(QDialog):
+    """Ctrl+K hızlı geçiş penceresi; başlıklarda bulanık arar, seçilen karta gider."""
+    RESULT_LIMIT = 20
+    # Yazma durduktan sonra aramaya kadar beklenen süre (ms)
+    DELAY_MS = 60
+
+    def __init__(self, task_index, parent=None):
+        super().__init__(parent, Qt.Popup | Qt.FramelessWindowHint)
+        self.setObjectName("taskPalette")
+        self.setMinimumWidth(560)
+        self.task_index = task_index
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        layout.setContentsMargins(12, 12, 12, 12)
+        
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("🔎 Göreve git...")
+        self.query_input.setFont(QFont("Segoe UI", 12))
+        self.query_input.returnPressed.connect(self.choose_current)
+        layout.addWidget(self.query_input)
+        
+        self.result_list = QListWidget()
+        self.result_list.setFont(QFont("Segoe UI", 11))
+        self.result_list.setMinimumHeight(320)
+        self.result_list.itemActivated.connect(self.choose_current)
+        layout.addWidget(self.result_list)
+        
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.DELAY_MS)
+        self.search_timer.timeout.connect(self.refresh)
+        self.query_input.textChanged.connect(self.search_timer.start)
+
+    def popup(self):
+        self.query_input.clear()
+        self.result_list.clear()
+        parent = self.parentWidget()
+        self.adjustSize()
+        top_center = parent.mapToGlobal(QPoint(parent.width() // 2, parent.height() // 6))
+        self.move(top_center.x() - self.width() // 2, top_center.y())
+        self.show()
+        self.query_input.setFocus()
+
+    def refresh(self):
+        self.result_list.clear()
+        for task_id, title, category in self.task_index.search(self.query_input.text(),
+                                                                self.RESULT_LIMIT):
+            item = QListWidgetItem(f"{title}    ·    {category_name(category)}")
+            item.setData(Qt.UserRole, task_id)
+            self.result_list.addItem(item)
+        if self.result_list.count():
+            self.result_list.setCurrentRow(0)
+
+    def keyPressEvent(self, event):
+        # Ok tuşları arama kutusundayken de sonuçlar arasında gezer
+        if event.key() in (Qt.Key_Up, Qt.Key_Down) and self.result_list.count():
+            step = -1 if event.key() == Qt.Key_Up else 1
+            row = (self.result_list.currentRow() + step) % self.result_list.count()
+            self.result_list.setCurrentRow(row)
+            return
+        super().keyPressEvent(event)
+
+    def choose_current(self):
+        if self.search_timer.isActive():
+            self.search_timer.stop()
+            self.refresh()
+        item = self.result_list.currentItem()
+        if item is None:
+            return
+        self.accept()
+        self.parentWidget().reveal_task(item.data(Qt.UserRole))
+
 class TodoApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, profiler=None):
         super().__init__()
+        self.profiler = profiler or StartupProfiler()
         self.setWindowTitle("Ta-Du")
+        # Uygulama stil sayfası kuralları bu isimle sınırlandırılır
+        self.setObjectName("mainWindow")
+        self.theme_engine = ThemeEngine()
+        self.close_button = None
+        # Diyaloglar ilk kullanımda oluşturulur ve saklanır
+        self.edit_dialog = None
+        self.help_dialog = None
+        self.help_label = None
+        self.developer_dialog = None
+        self.calendar_popup = None
+        self.calendar_callback = None
         
         # İlk minimize kontrolü için flag
         self.first_minimize = True
@@ -399,33 +2876,58 @@ class TodoApp(QMainWindow):
         # Veritabanı klasörünü oluştur ve bağlantıyı kur
         db_folder = os.path.join(os.path.expanduser("~"), "Documents", "Ta-Du")
         os.makedirs(db_folder, exist_ok=True)
-        db_path = os.path.join(db_folder, "tasks.db")
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
+        self.db_path = os.path.join(db_folder, "tasks.db")
+        # Son panonun anlık görüntüsü; varsa pano veritabanı okunmadan çizilir
+        self.snapshot_path = os.path.join(db_folder, "board.snapshot")
+        snapshot = read_board_snapshot(self.snapshot_path)
+        self.snapshot_version = snapshot[0] if snapshot else None
+        # Arayüz iş parçacığındaki bağlantı sadece okuma için kullanılır
+        self.repository = TaskRepository.open(self.db_path)
         self.create_tables()
         
+        # Yazmalar arka plandaki iş parçacığında yapılır; arayüz iyimser güncellenir
+        self.next_task_id = self.repository.next_task_id()
+        # Sütunların son sıra değerleri; yeni ve taşınan kartlar sona eklenir
+        self.tail_positions = {category: self.repository.last_position(category)
+                               for category in range(len(CATEGORIES))}
+        # Sıra değerleri uzayan sütunlar; pencere gizlenirken yeniden dağıtılır
+        self.rebalance_needed = set()
+        # Sütunların sıralama kipleri; settings tablosunda 'sort:<kategori kodu>' olarak saklanır
+        self.sort_modes = self.repository.sort_modes()
+        # Ekleme, düzenleme, taşıma ve silme komutlarının geri al/yinele geçmişi
+        self.history = CommandHistory()
+        # Yüklü görevlerin tek kaynağı; listeler satırlarını buradan çizer
+        self.task_store = TaskStore()
+        # Henüz diske yazılmamış görevler: id -> Task (silinenler için None)
+        self.pending_tasks = {}
+        self.submitted_writes = 0
+        self.db_worker = DatabaseWorker(self.db_path)
+        self.db_worker.idle.connect(self.on_writes_flushed)
+        self.db_worker.failed.connect(self.on_write_failed)
+        self.db_worker.start()
+        QApplication.instance().aboutToQuit.connect(self.shutdown_database)
+        # Arama iş parçacığı ilk aramada başlatılır; eski isteklerin sonuçları atılır
+        self.search_worker = None
+        self.search_request = 0
+        # Arama kutusu ve süzgeç çubuğundan oluşan pano süzgeci; tarih aralığı (başlangıç, bitiş)
+        self.board_filter = TaskFilter()
+        self.filter_dates = ["", ""]
+        # Ctrl+K paleti için başlık trigram indeksi; ilk kareden sonra parça parça kurulur,
+        # sonra her yazmayla artımlı güncellenir
+        self.task_index = TrigramIndex()
+        self.task_index_cursor = 0
+        self.task_index_building = False
+        self.task_palette = None
+        
         # Kaydedilmiş tema tercihini yükle
-        self.dark_theme = self.load_theme_preference()
+        self.dark_theme = snapshot[1] if snapshot else self.load_theme_preference()
+        self.profiler.mark("Veritabanı")
         
         # Logo ayarla
         self.setWindowIcon(QIcon(resource_path('tadu.ico')))
         
-        # Sistem tepsisi ikonu oluştur
-        self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon(resource_path('tadu.ico')))
-        self.tray_icon.setToolTip('Ta-Du')
-        
-        # Tepsi menüsü
-        tray_menu = QMenu()
-        show_action = tray_menu.addAction("Göster")
-        quit_action = tray_menu.addAction("Çıkış")
-        
-        show_action.triggered.connect(self.showNormal)
-        quit_action.triggered.connect(app.quit)
-        
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.activated.connect(self.tray_icon_activated)
-        self.tray_icon.show()
+        # Sistem tepsisi ve sesler ilk kareden sonra kurulur (finish_startup)
+        self.tray_icon = None
         
         # Ana widget ve layout
         self.central_widget = QWidget()
@@ -446,12 +2948,12 @@ class TodoApp(QMainWindow):
         title_layout.setSpacing(5)
         
         title_label = QLabel("Ta-Du")
+        title_label.setObjectName("appTitle")
         title_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        title_label.setStyleSheet(f"color: {'white' if self.dark_theme else '#1a202c'};")
         
         version_label = QLabel("v1.1.0")
+        version_label.setObjectName("versionLabel")
         version_label.setFont(QFont("Segoe UI", 8))
-        version_label.setStyleSheet(f"color: {'white' if self.dark_theme else '#1a202c'}; padding-top: 5px;")
         
         title_layout.addWidget(title_label)
         title_layout.addWidget(version_label)
@@ -466,31 +2968,24 @@ class TodoApp(QMainWindow):
         
         # Kapatma butonu
         close_button = QPushButton("✖", self)
+        close_button.setObjectName("closeButton")
         close_button.setFont(QFont("Segoe UI", 14))
         close_button.setCursor(Qt.PointingHandCursor)
         close_button.clicked.connect(self.minimize_to_tray)
         close_button.setFixedSize(40, 40)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                color: """ + ("white" if self.dark_theme else "#1a202c") + """;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                color: #e53e3e;
-            }
-        """)
         top_container_layout.addWidget(close_button)
+        self.close_button = close_button
         
         # Top container'ı ana layout'a ekle
         self.main_layout.addWidget(top_container)
         
         # Üst panel (Görev ekleme)
         self.setup_top_panel()
+        self.setup_filter_bar()
         
         # Kartlar alanı
         self.setup_cards_area()
+        QShortcut(QKeySequence("Ctrl+K"), self, self.show_palette)
         
         # Tema değiştirme butonu ve yardım butonu için container
         buttons_container = QWidget()
@@ -518,20 +3013,57 @@ class TodoApp(QMainWindow):
         buttons_layout.addWidget(self.dev_button)
         
         self.main_layout.addWidget(buttons_container)
+        self.profiler.mark("Arayüz")
         
         # Önce tema ayarını uygula
         self.apply_theme()
+        self.profiler.mark("Tema")
         
-        # Sonra görevleri yükle
-        self.load_tasks()
+        # Sonra görevlerin ilk sayfasını yükle; anlık görüntü varsa ondan
+        if snapshot:
+            self.restore_snapshot(snapshot[2])
+        else:
+            self.load_tasks()
+        self.profiler.mark("İlk sayfa")
+        
+        # Olay döngüsü boşaldığında ikincil bileşenleri kur
+        QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        self.profiler.mark("İlk kare")
+        self.reconcile_snapshot()
+        self.profiler.mark("Anlık görüntü doğrulama")
+        self.start_task_index()
+        self.setup_tray_icon()
+        self.profiler.mark("Sistem tepsisi")
+        init_sounds()
+        self.profiler.mark("Sesler")
+        self.profiler.report()
+
+    def setup_tray_icon(self):
+        # Sistem tepsisi ikonu oluştur
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(QIcon(resource_path('tadu.ico')))
+        self.tray_icon.setToolTip('Ta-Du')
+        
+        # Tepsi menüsü
+        tray_menu = QMenu(self)
+        show_action = tray_menu.addAction("Göster")
+        quit_action = tray_menu.addAction("Çıkış")
+        
+        show_action.triggered.connect(self.showNormal)
+        quit_action.triggered.connect(self.quit_app)
+        
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_icon.show()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         # Kapatma butonunu yeniden konumlandır ve en üstte tut
-        close_button = self.findChild(QPushButton, "")
-        if close_button and close_button.text() == "✖":
-            close_button.move(self.width() - 50, 10)
-            close_button.raise_()  # Her boyut değişiminde en üstte tut
+        if self.close_button is not None:
+            self.close_button.move(self.width() - 50, 10)
+            self.close_button.raise_()  # Her boyut değişiminde en üstte tut
 
     def changeEvent(self, event):
         if event.type() == Qt.WindowState:
@@ -552,12 +3084,108 @@ class TodoApp(QMainWindow):
 
     def closeEvent(self, event):
         # Çarpıya basıldığında sistem tepsisine küçült
-        if self.tray_icon.isVisible():
+        if self.tray_icon is not None and self.tray_icon.isVisible():
+            self.save_snapshot()
             self.hide()
             event.ignore()
         else:
-            self.conn.close()
+            self.shutdown_database()
             event.accept()
+            
+    def flush_writes(self):
+        # Bekleyen yazmaları diske işle
+        if self.db_worker is not None:
+            self.db_worker.flush()
+            
+    def quit_app(self):
+        # Tepsi menüsünden çıkış: önce bekleyen yazmaları kaydet
+        self.shutdown_database()
+        QApplication.instance().quit()
+        
+    def shutdown_database(self):
+        # Bekleyen yazmaları bitir ve bağlantıları kapat
+        if self.db_worker is None:
+            return
+        self.save_snapshot()
+        if self.search_worker is not None:
+            self.search_worker.stop()
+            self.search_worker = None
+        self.db_worker.stop()
+        self.db_worker = None
+        self.repository.close()
+        
+    def save_snapshot(self):
+        # Kullanıcı etkileşimi yokken uzayan sıra değerlerini yeniden dağıt
+        if self.rebalance_needed:
+            self.rebalance_positions()
+        # Yazmalar diske işlendikten sonra panonun ilk sayfalarını sürümüyle birlikte kaydet
+        self.flush_writes()
+        columns = [self.category_lists[category].task_model.snapshot(TaskListModel.PAGE_SIZE)
+                   for category in range(len(CATEGORIES))]
+        if None in columns:
+            # Süzgeç açıkken değişen sütunun asıl satırları bilinmiyor; eski anlık
+            # görüntünün sürümü tutmayacağı için açılışta pano yeniden yüklenir
+            return
+        try:
+            write_board_snapshot(self.snapshot_path, self.repository.board_version(),
+                                 self.dark_theme, columns)
+        except (OSError, struct.error) as e:
+            print(f"Anlık görüntü kaydedilemedi: {e}")
+            
+    def rebalance_positions(self):
+        for category in sorted(self.rebalance_needed):
+            self.run_write("rebalance", category)
+        self.rebalance_needed.clear()
+        self.flush_writes()
+        # Bekleyen her şey yazıldı; listeleri yeni sıra değerleriyle yeniden yükle
+        self.on_writes_flushed(self.db_worker.processed)
+        self.tail_positions = {category: self.repository.last_position(category)
+                               for category in range(len(CATEGORIES))}
+        # Geçmişteki eski sıra değerleri artık geçersiz
+        self.history.clear()
+        self.load_tasks()
+        
+    def restore_snapshot(self, columns):
+        self.task_store.clear()
+        for category, (tasks, has_more) in enumerate(columns):
+            self.category_lists[category].task_model.restore(tasks, has_more)
+            
+    def reconcile_snapshot(self):
+        # Anlık görüntü alındıktan sonra veritabanı değiştiyse panoyu yeniden yükle
+        if self.snapshot_version is None:
+            return
+        snapshot_version, self.snapshot_version = self.snapshot_version, None
+        if self.repository.board_version() == snapshot_version:
+            return
+        dark_theme = self.load_theme_preference()
+        if dark_theme != self.dark_theme:
+            self.dark_theme = dark_theme
+            self.apply_theme()
+        self.load_tasks()
+        
+    def run_write(self, method, *args, pending=None):
+        # Depo yazmasını arka plana gönder; pending: {görev id: yeni görev veya None}
+        if pending:
+            self.pending_tasks.update(pending)
+            self.task_index.update(pending)
+        self.submitted_writes += 1
+        self.db_worker.submit(method, *args)
+        
+    def on_writes_flushed(self, processed):
+        # Gönderilen tüm yazmalar işlendiyse iyimser kayıtlar artık gereksiz
+        if processed == self.submitted_writes:
+            self.pending_tasks.clear()
+            
+    def on_write_failed(self, method, error):
+        print(f"Veritabanı yazma hatası: {error}")
+        QMessageBox.warning(self, "Uyarı", f"Değişiklik kaydedilemedi:\n{error}")
+        # Arayüzü veritabanındaki gerçek durumla eşitle
+        self.pending_tasks.clear()
+        self.load_tasks()
+        # İndekse işlenmiş ama yazılamamış değişiklikler de geri alınmalı
+        self.task_index.clear()
+        self.task_index_cursor = 0
+        self.start_task_index()
 
     def keyPressEvent(self, event):
         # Alt+Tab tuş kombinasyonu için
@@ -599,7 +3227,7 @@ class TodoApp(QMainWindow):
         priority_layout.addWidget(priority_label)
         
         self.priority_combo = QComboBox()
-        self.priority_combo.addItems(["Düşük", "Orta", "Yüksek"])
+        self.priority_combo.addItems(PRIORITIES)
         self.priority_combo.setFont(QFont("Segoe UI", 11))
         self.priority_combo.setFixedWidth(120)
         priority_layout.addWidget(self.priority_combo)
@@ -615,7 +3243,7 @@ class TodoApp(QMainWindow):
         category_layout.addWidget(category_label)
         
         self.category_combo = QComboBox()
-        self.category_combo.addItems(["Yapılacak", "Yapılıyor", "Bitti", "Dilek Listesi"])
+        self.category_combo.addItems(CATEGORIES)
         self.category_combo.setFont(QFont("Segoe UI", 11))
         self.category_combo.setFixedWidth(150)
         category_layout.addWidget(self.category_combo)
@@ -658,53 +3286,125 @@ class TodoApp(QMainWindow):
         self.add_button.setFixedWidth(100)
         add_layout.addWidget(self.add_button)
         
+        # Arama kutusu; yazma durduktan sonra arama arka planda yapılır
+        search_container = QWidget()
+        search_layout = QVBoxLayout(search_container)
+        search_layout.setSpacing(2)
+        search_layout.setContentsMargins(0, 0, 0, 0)
+        
+        search_label = QLabel("🔍 Ara")
+        search_label.setFont(QFont("Segoe UI", 10))
+        search_layout.addWidget(search_label)
+        
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Görevlerde ara...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setMinimumWidth(250)
+        self.search_input.setFont(QFont("Segoe UI", 11))
+        search_layout.addWidget(self.search_input)
+        
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.apply_filter)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        
         # Üst panel bileşenleri
         self.top_layout.addWidget(input_container, 4)
         self.top_layout.addWidget(priority_container, 1)
         self.top_layout.addWidget(category_container, 1)
         self.top_layout.addWidget(date_container, 1)
         self.top_layout.addWidget(add_container, 1)
+        self.top_layout.addWidget(search_container, 2)
         
         self.main_layout.addWidget(self.top_panel)
         
+    def setup_filter_bar(self):
+        # Öncelik, tarih aralığı, gecikenler ve bu hafta süzgeçleri; seçimler birleştirilir
+        filter_bar = QWidget()
+        filter_layout = QHBoxLayout(filter_bar)
+        filter_layout.setSpacing(8)
+        filter_layout.setContentsMargins(10, 0, 10, 0)
+        
+        filter_label = QLabel("🎚️ Süzgeç")
+        filter_label.setFont(QFont("Segoe UI", 10))
+        filter_layout.addWidget(filter_label)
+        
+        def filter_button(text, on_click):
+            button = QPushButton(text)
+            button.setObjectName("filterButton")
+            button.setFont(QFont("Segoe UI", 10))
+            button.setCheckable(True)
+            button.setCursor(Qt.PointingHandCursor)
+            button.clicked.connect(on_click)
+            filter_layout.addWidget(button)
+            return button
+        
+        self.priority_filter_buttons = {
+            priority: filter_button(f"⚡ {name}", self.apply_filter)
+            for priority, name in enumerate(PRIORITIES)
+        }
+        self.overdue_button = filter_button("⏰ Gecikmiş", self.apply_filter)
+        self.week_button = filter_button("📆 Bu Hafta", self.apply_filter)
+        self.filter_date_buttons = [
+            filter_button("", partial(self.choose_filter_date, bound)) for bound in (0, 1)
+        ]
+        self.update_filter_date_buttons()
+        
+        clear_button = QPushButton("✖ Temizle")
+        clear_button.setObjectName("filterButton")
+        clear_button.setFont(QFont("Segoe UI", 10))
+        clear_button.setCursor(Qt.PointingHandCursor)
+        clear_button.clicked.connect(self.clear_filters)
+        filter_layout.addWidget(clear_button)
+        filter_layout.addStretch()
+        
+        self.main_layout.addWidget(filter_bar)
+        
     def setup_cards_area(self):
+        # Sütun başlıklarındaki sıralama seçicileri; kategori -> QComboBox
+        self.sort_combos = {}
         self.cards_widget = QWidget()
         self.cards_layout = QHBoxLayout(self.cards_widget)
         self.cards_layout.setSpacing(20)
         
         # Liste alanları
-        self.todo_list = TaskList("Yapılacak")
-        self.doing_list = TaskList("Yapılıyor")
-        self.done_list = TaskList("Bitti")
-        self.wishlist = TaskList("Dilek Listesi")
+        self.todo_list = TaskList(TODO, self.task_store, self.fetch_task_page,
+                                  self.resolve_pending_rows)
+        self.doing_list = TaskList(DOING, self.task_store, self.fetch_task_page,
+                                  self.resolve_pending_rows)
+        self.done_list = TaskList(DONE, self.task_store, self.fetch_task_page,
+                                  self.resolve_pending_rows)
+        self.wishlist = TaskList(WISHLIST, self.task_store, self.fetch_task_page,
+                                  self.resolve_pending_rows)
         
         # Liste başlıkları ve containerlar
         todo_container = QWidget()
         todo_layout = QVBoxLayout(todo_container)
         self.todo_title = QLabel("📋 Yapılacak")
         self.todo_title.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        todo_layout.addWidget(self.todo_title)
+        todo_layout.addLayout(self.column_header(self.todo_title, TODO))
         todo_layout.addWidget(self.todo_list)
         
         doing_container = QWidget()
         doing_layout = QVBoxLayout(doing_container)
         self.doing_title = QLabel("🔄 Yapılıyor")
         self.doing_title.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        doing_layout.addWidget(self.doing_title)
+        doing_layout.addLayout(self.column_header(self.doing_title, DOING))
         doing_layout.addWidget(self.doing_list)
         
         done_container = QWidget()
         done_layout = QVBoxLayout(done_container)
         self.done_title = QLabel("✅ Bitti")
         self.done_title.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        done_layout.addWidget(self.done_title)
+        done_layout.addLayout(self.column_header(self.done_title, DONE))
         done_layout.addWidget(self.done_list)
         
         wishlist_container = QWidget()
         wishlist_layout = QVBoxLayout(wishlist_container)
         self.wishlist_title = QLabel("⭐ Dilek Listesi")
         self.wishlist_title.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        wishlist_layout.addWidget(self.wishlist_title)
+        wishlist_layout.addLayout(self.column_header(self.wishlist_title, WISHLIST))
         wishlist_layout.addWidget(self.wishlist)
         
         self.cards_layout.addWidget(todo_container)
@@ -712,429 +3412,122 @@ class TodoApp(QMainWindow):
         self.cards_layout.addWidget(done_container)
         self.cards_layout.addWidget(wishlist_container)
         
+        # Kategori -> liste eşlemesi
+        self.category_lists = {
+            TODO: self.todo_list,
+            DOING: self.doing_list,
+            DONE: self.done_list,
+            WISHLIST: self.wishlist,
+        }
+        # Listeler henüz boş; kayıtlı kip ilk sayfa yüklenmeden atanır
+        for category, task_list in self.category_lists.items():
+            task_list.task_model.sort_mode = self.sort_modes[category]
+        
         self.main_layout.addWidget(self.cards_widget)
         
-    def create_tables(self):
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            category TEXT NOT NULL,
-            priority TEXT NOT NULL,
-            due_date TEXT NOT NULL,
-            completed INTEGER DEFAULT 0
-        )
-        ''')
+    def column_header(self, title_label, category):
+        # Sütun başlığı ve sütunun sıralama kipi seçicisi
+        header = QHBoxLayout()
+        header.addWidget(title_label)
+        header.addStretch()
+        sort_combo = QComboBox()
+        sort_combo.setFont(QFont("Segoe UI", 10))
+        sort_combo.setToolTip("Sütun sıralaması")
+        for mode, (label, _) in SORT_MODES.items():
+            sort_combo.addItem(label, mode)
+        sort_combo.setCurrentIndex(sort_combo.findData(self.sort_modes[category]))
+        sort_combo.activated.connect(partial(self.on_sort_selected, category))
+        header.addWidget(sort_combo)
+        self.sort_combos[category] = sort_combo
+        return header
+        
+    def on_sort_selected(self, category, index):
+        self.set_column_sort(category, self.sort_combos[category].itemData(index))
+        
+    def set_column_sort(self, category, sort_mode):
+        # Kipi kaydet ve sütunu yeni kipin indeksinden baştan yükle
+        model = self.category_lists[category].task_model
+        self.sort_modes[category] = sort_mode
+        self.sort_combos[category].setCurrentIndex(self.sort_combos[category].findData(sort_mode))
+        self.run_write("set_setting", f"sort:{category}", sort_mode)
+        if not model.set_sort_mode(sort_mode):
+            return
+        self.merge_pending_rows(model)
+        # Yeniden yükleme süzgeci kapattı; süzgeç açıksa yeniden uygula
+        if not self.board_filter.is_empty():
+            self.apply_filter()
         
-        # Tema tercihi için tablo oluştur
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS settings (
-            key TEXT PRIMARY KEY,
-            value TEXT NOT NULL
-        )
-        ''')
-        self.conn.commit()
+    def create_tables(self):
+        # Şemayı sürümlü göçlerle güncelle; eski veritabanları yerinde yükseltilir
+        self.migration_progress = None
+        self.repository.migrate(self.report_migration_progress)
+        if self.migration_progress is not None:
+            self.migration_progress.close()
+            self.migration_progress.deleteLater()
+            self.migration_progress = None
+            
+    def report_migration_progress(self, done, total):
+        # Büyük veritabanlarında ilerleme penceresi göster, arayüz donmasın
+        if self.migration_progress is None:
+            self.migration_progress = QProgressDialog("Veritabanı güncelleniyor...", None, 0, total, self)
+            self.migration_progress.setWindowTitle("Ta-Du")
+            self.migration_progress.setWindowModality(Qt.ApplicationModal)
+            self.migration_progress.setMinimumDuration(500)
+        self.migration_progress.setValue(done)
+        QApplication.processEvents()
         
     def load_theme_preference(self):
-        self.cursor.execute("SELECT value FROM settings WHERE key = 'theme'")
-        result = self.cursor.fetchone()
-        return result[0] == 'dark' if result else False
+        return self.repository.get_setting('theme') == 'dark'
         
     def save_theme_preference(self):
         theme_value = 'dark' if self.dark_theme else 'light'
-        self.cursor.execute("""
-            INSERT OR REPLACE INTO settings (key, value)
-            VALUES ('theme', ?)
-        """, (theme_value,))
-        self.conn.commit()
+        self.run_write("set_setting", 'theme', theme_value)
         
     def toggle_theme(self):
         self.dark_theme = not self.dark_theme
         self.save_theme_preference()
         self.apply_theme()
         
+    def theme_name(self):
+        return "dark" if self.dark_theme else "light"
+        
     def apply_theme(self):
-        # Liste stillerini güncelle
-        self.todo_list.updateStyle(self.dark_theme)
-        self.doing_list.updateStyle(self.dark_theme)
-        self.done_list.updateStyle(self.dark_theme)
-        self.wishlist.updateStyle(self.dark_theme)
-        
-        # Başlık renklerini güncelle
-        title_color = "white" if self.dark_theme else "#2d3748"
-        for title in [self.todo_title, self.doing_title, self.done_title, self.wishlist_title]:
-            title.setStyleSheet(f"color: {title_color}; background: transparent;")
-            
-        # Ta-Du başlığı ve versiyon etiketinin rengini güncelle
-        for label in self.findChildren(QLabel):
-            if label.text() == "Ta-Du":
-                label.setStyleSheet(f"color: {'white' if self.dark_theme else '#1a202c'}; background: transparent;")
-            elif label.text() == "v1.1.0":
-                label.setStyleSheet(f"color: {'white' if self.dark_theme else '#1a202c'}; background: transparent; padding-top: 5px;")
-            
-        # Kapatma butonunun rengini güncelle
-        for button in self.findChildren(QPushButton):
-            if button.text() == "✖":
-                button.setStyleSheet("""
-                    QPushButton {
-                        background-color: transparent;
-                        border: none;
-                        color: """ + ("white" if self.dark_theme else "#1a202c") + """;
-                        padding: 0px;
-                    }
-                    QPushButton:hover {
-                        color: #e53e3e;
-                    }
-                """)
-        
-        if self.dark_theme:
-            self.setStyleSheet("""
-                QMainWindow, QWidget { 
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                              stop:0 #1a202c, stop:1 #2d3748); 
-                }
-                QPushButton { 
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                              stop:0 #4299e1, stop:1 #3182ce);
-                    color: white; 
-                    border: none; 
-                    padding: 12px; 
-                    border-radius: 8px;
-                }
-                QPushButton:hover { 
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                              stop:0 #3182ce, stop:1 #2c5282);
-                }
-                QPushButton#dateButton {
-                    background: #2d3748;
-                    border: 2px solid #4a5568;
-                    color: white;
-                    padding: 8px 16px;
-                    text-align: left;
-                    font-weight: normal;
-                }
-                QPushButton#dateButton:hover {
-                    background: #4a5568;
-                    border: 2px solid #718096;
-                }
-                QLineEdit { 
-                    background-color: #2d3748; 
-                    color: white; 
-                    border: 2px solid #4a5568;
-                    padding: 8px 12px;
-                    border-radius: 8px;
-                    min-height: 20px;
-                }
-                QComboBox {
-                    background-color: #2d3748;
-                    color: white;
-                    border: 2px solid #4a5568;
-                    border-radius: 8px;
-                    padding: 4px 8px;
-                    min-height: 20px;
-                    margin: 0px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    padding-right: 8px;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    width: 0px;
-                    height: 0px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2d3748;
-                    color: white;
-                    selection-background-color: #4299e1;
-                    border: 2px solid #4a5568;
-                    border-radius: 8px;
-                    padding: 4px;
-                    outline: none;
-                }
-                QComboBox QAbstractItemView::item {
-                    padding: 4px 8px;
-                    min-height: 20px;
-                    border: none;
-                }
-                QComboBox QAbstractItemView::item:hover {
-                    background-color: #4a5568;
-                }
-                QComboBox QAbstractItemView::item:selected {
-                    background-color: #4299e1;
-                }
-                QCalendarWidget { 
-                    background-color: #2d3748; 
-                    color: white;
-                    selection-background-color: #4299e1;
-                }
-                QLabel {
-                    color: white;
-                    font-size: 14px;
-                    background: transparent;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow, QWidget { 
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                              stop:0 #f7fafc, stop:1 #edf2f7);
-                }
-                QPushButton { 
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                              stop:0 #4299e1, stop:1 #3182ce);
-                    color: white; 
-                    border: none; 
-                    padding: 12px; 
-                    border-radius: 8px;
-                }
-                QPushButton:hover { 
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                              stop:0 #3182ce, stop:1 #2c5282);
-                }
-                QPushButton#dateButton {
-                    background: white;
-                    border: 2px solid #e2e8f0;
-                    color: #2d3748;
-                    padding: 8px 16px;
-                    text-align: left;
-                    font-weight: normal;
-                }
-                QPushButton#dateButton:hover {
-                    background: #f7fafc;
-                    border: 2px solid #cbd5e0;
-                }
-                QLineEdit { 
-                    background-color: white; 
-                    color: #2d3748; 
-                    border: 2px solid #e2e8f0;
-                    padding: 8px 12px;
-                    border-radius: 8px;
-                    min-height: 20px;
-                }
-                QComboBox {
-                    background-color: white;
-                    color: #2d3748;
-                    border: 2px solid #e2e8f0;
-                    border-radius: 8px;
-                    padding: 4px 8px;
-                    min-height: 20px;
-                    margin: 0px;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    padding-right: 8px;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    width: 0px;
-                    height: 0px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: white;
-                    color: #2d3748;
-                    selection-background-color: #4299e1;
-                    border: 2px solid #e2e8f0;
-                    border-radius: 8px;
-                    padding: 4px;
-                    outline: none;
-                }
-                QComboBox QAbstractItemView::item {
-                    padding: 4px 8px;
-                    min-height: 20px;
-                    border: none;
-                }
-                QComboBox QAbstractItemView::item:hover {
-                    background-color: #edf2f7;
-                }
-                QComboBox QAbstractItemView::item:selected {
-                    background-color: #4299e1;
-                    color: white;
-                }
-                QCalendarWidget { 
-                    background-color: white; 
-                    color: #2d3748;
-                    selection-background-color: #4299e1;
-                }
-                QLabel {
-                    color: #2d3748;
-                    font-size: 14px;
-                    background: transparent;
-                }
-            """)
-            
-        # Tüm kartların stillerini güncelle
-        self.update_all_cards_style()
-        
-    def update_all_cards_style(self):
-        # Tüm listelerdeki kartları güncelle
-        lists = [self.todo_list, self.doing_list, self.done_list, self.wishlist]
-        for task_list in lists:
-            for i in range(task_list.count()):
-                item = task_list.item(i)
-                card = task_list.itemWidget(item)
-                if card:
-                    card.updateStyle(self.dark_theme)
+        # Önceden derlenmiş tema stil sayfasını uygula; diyaloglar açılırken güncellenir
+        self.theme_engine.apply(self.theme_name())
+        
+        # Kart renkleri boyayıcıda; sadece görünür satırlar yeniden çizilir
+        for task_list in self.category_lists.values():
+            task_list.updateStyle(self.dark_theme)
             
     def show_calendar(self):
-        calendar = QCalendarWidget(self)
-        calendar.setMinimumDate(QDate.currentDate())
-        calendar.setSelectedDate(self.selected_date)
-        calendar.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
-        calendar.setFixedWidth(400)  # Takvim genişliğini sabitle
-        
-        # Takvim stilini ayarla
-        if self.dark_theme:
-            calendar.setStyleSheet("""
-                QCalendarWidget {
-                    background-color: #2d3748;
-                    border: 2px solid #4a5568;
-                    border-radius: 12px;
-                }
-                QCalendarWidget QToolButton {
-                    color: white;
-                    background-color: transparent;
-                    padding: 8px;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QCalendarWidget QToolButton:hover {
-                    background-color: #4a5568;
-                }
-                QCalendarWidget QMenu {
-                    background-color: #2d3748;
-                    color: white;
-                    border: 1px solid #4a5568;
-                    border-radius: 4px;
-                }
-                QCalendarWidget QSpinBox {
-                    color: white;
-                    background-color: #2d3748;
-                    selection-background-color: #4299e1;
-                    selection-color: white;
-                    border: 1px solid #4a5568;
-                    border-radius: 4px;
-                    padding: 2px;
-                }
-                QCalendarWidget QTableView {
-                    background-color: #2d3748;
-                    selection-background-color: #4299e1;
-                    selection-color: white;
-                    outline: none;
-                }
-                QCalendarWidget QAbstractItemView:enabled {
-                    color: white;
-                    background-color: #2d3748;
-                    selection-background-color: #4299e1;
-                    selection-color: white;
-                }
-                QCalendarWidget QWidget#qt_calendar_navigationbar {
-                    background-color: #1a202c;
-                    border-top-left-radius: 12px;
-                    border-top-right-radius: 12px;
-                    padding: 4px;
-                }
-                QCalendarWidget QWidget#qt_calendar_prevmonth,
-                QCalendarWidget QWidget#qt_calendar_nextmonth {
-                    color: white;
-                    qproperty-icon: none;
-                    min-width: 32px;
-                    max-width: 32px;
-                    min-height: 32px;
-                    max-height: 32px;
-                }
-                QCalendarWidget QWidget#qt_calendar_prevmonth {
-                    qproperty-text: "◀";
-                }
-                QCalendarWidget QWidget#qt_calendar_nextmonth {
-                    qproperty-text: "▶";
-                }
-                QCalendarWidget QWidget { 
-                    alternate-background-color: #2d3748;
-                }
-                QCalendarWidget QAbstractItemView:disabled {
-                    color: #4a5568;
-                }
-            """)
+        self.open_calendar(self.date_button, self.selected_date, self.set_selected_date)
+        
+    def set_selected_date(self, date):
+        self.selected_date = date
+        self.date_button.setText(f"📅 {date.toString('dd.MM.yy')}")
+        
+    def open_calendar(self, anchor, selected_date, on_selected, past=False):
+        # Tek takvim açılır penceresi; ana pencere ve düzenleme diyaloğu tarafından paylaşılır
+        calendar = self.calendar_popup
+        if calendar is None:
+            calendar = self.calendar_popup = QCalendarWidget(self)
+            calendar.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
+            calendar.setFixedWidth(400)  # Takvim genişliğini sabitle
+            calendar.clicked.connect(self.on_calendar_date_selected)
+        # Modal diyalogdan açılırken takvim o diyaloğun alt penceresi olmalı
+        if calendar.parentWidget() is not anchor.window():
+            calendar.setParent(anchor.window(), Qt.Popup | Qt.FramelessWindowHint)
+        self.theme_engine.style(calendar, "calendar", self.theme_name())
+        # Görev tarihleri bugünden başlar; süzgeç aralığı geçmişi de kapsayabilir
+        if past:
+            calendar.setMinimumDate(QDate(1900, 1, 1))
         else:
-            calendar.setStyleSheet("""
-                QCalendarWidget {
-                    background-color: white;
-                    border: 2px solid #e2e8f0;
-                    border-radius: 12px;
-                }
-                QCalendarWidget QToolButton {
-                    color: #2d3748;
-                    background-color: transparent;
-                    padding: 8px;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QCalendarWidget QToolButton:hover {
-                    background-color: #edf2f7;
-                }
-                QCalendarWidget QMenu {
-                    background-color: white;
-                    color: #2d3748;
-                    border: 1px solid #e2e8f0;
-                    border-radius: 4px;
-                }
-                QCalendarWidget QSpinBox {
-                    color: #2d3748;
-                    background-color: white;
-                    selection-background-color: #4299e1;
-                    selection-color: white;
-                    border: 1px solid #e2e8f0;
-                    border-radius: 4px;
-                    padding: 2px;
-                }
-                QCalendarWidget QTableView {
-                    background-color: white;
-                    selection-background-color: #4299e1;
-                    selection-color: white;
-                    outline: none;
-                }
-                QCalendarWidget QAbstractItemView:enabled {
-                    color: #2d3748;
-                    background-color: white;
-                    selection-background-color: #4299e1;
-                    selection-color: white;
-                }
-                QCalendarWidget QWidget#qt_calendar_navigationbar {
-                    background-color: #f7fafc;
-                    border-top-left-radius: 12px;
-                    border-top-right-radius: 12px;
-                    padding: 4px;
-                }
-                QCalendarWidget QWidget#qt_calendar_prevmonth,
-                QCalendarWidget QWidget#qt_calendar_nextmonth {
-                    color: #2d3748;
-                    qproperty-icon: none;
-                    min-width: 32px;
-                    max-width: 32px;
-                    min-height: 32px;
-                    max-height: 32px;
-                }
-                QCalendarWidget QWidget#qt_calendar_prevmonth {
-                    qproperty-text: "◀";
-                }
-                QCalendarWidget QWidget#qt_calendar_nextmonth {
-                    qproperty-text: "▶";
-                }
-                QCalendarWidget QWidget { 
-                    alternate-background-color: white;
-                }
-                QCalendarWidget QAbstractItemView:disabled {
-                    color: #cbd5e0;
-                }
-            """)
+            calendar.setMinimumDate(QDate.currentDate())
+        calendar.setSelectedDate(selected_date)
+        self.calendar_callback = on_selected
         
         # Takvimi düğmenin altında göster
-        button_pos = self.date_button.mapToGlobal(self.date_button.rect().bottomLeft())
+        button_pos = anchor.mapToGlobal(anchor.rect().bottomLeft())
         screen = QApplication.primaryScreen().geometry()
         
         # Takvimin ekrandan taşmasını önle
@@ -1145,349 +3538,436 @@ class TodoApp(QMainWindow):
         calendar_x = max(calendar_x, screen.left())
         
         calendar.move(calendar_x, calendar_y)
-        
-        def on_date_selected():
-            self.selected_date = calendar.selectedDate()
-            self.date_button.setText(f"📅 {self.selected_date.toString('dd.MM.yy')}")
-            calendar.close()
-            
-        calendar.clicked.connect(on_date_selected)
         calendar.show()
         
+    def on_calendar_date_selected(self, date):
+        self.calendar_popup.close()
+        if self.calendar_callback is not None:
+            self.calendar_callback(date)
+        
     def add_task(self):
         title = self.task_input.text().strip()
         if not title:
             QMessageBox.warning(self, "Uyarı", "Lütfen bir görev girin!")
             return
             
-        category = self.category_combo.currentText()
-        priority = self.priority_combo.currentText()
+        category = self.category_combo.currentIndex()
+        priority = self.priority_combo.currentIndex()
         due_date = self.selected_date.toString("yyyy-MM-dd")
         
-        self.cursor.execute('''
-        INSERT INTO tasks (title, category, priority, due_date)
-        VALUES (?, ?, ?, ?)
-        ''', (title, category, priority, due_date))
-        self.conn.commit()
-        task_id = self.cursor.lastrowid
+        task_id = self.next_task_id
+        self.next_task_id += 1
+        task = Task(task_id, title, category, priority, due_date, self.next_position(category))
+        self.run_write("insert_many", [task], pending={task_id: task})
+        self.history.record([(None, task)])
         
         play_add_sound()
         
         self.task_input.clear()
         self.selected_date = QDate.currentDate()
         self.date_button.setText("📅 Tarih Seç")
-        self.load_tasks()
+        self.add_task_item(task)
         
     def load_tasks(self):
-        self.todo_list.clear()
-        self.doing_list.clear()
-        self.done_list.clear()
-        self.wishlist.clear()
-        
-        self.cursor.execute("SELECT * FROM tasks WHERE completed = 0")
-        tasks = self.cursor.fetchall()
-        
-        for task in tasks:
-            card_widget = TaskCard(task[0], task[1], task[2], task[3], task[4])
-            # Kart oluşturulur oluşturulmaz tema ayarını uygula
-            card_widget.updateStyle(self.dark_theme)
+        # Her sütunun sadece ilk sayfasını yükler; kalanı kaydırdıkça gelir
+        self.task_store.clear()
+        for task_list in self.category_lists.values():
+            task_list.task_model.reload()
+            self.merge_pending_rows(task_list.task_model)
+        # Yeniden yükleme süzgeci kapatır; süzgeç açıksa yeniden uygula
+        if not self.board_filter.is_empty():
+            self.apply_filter()
             
-            item = QListWidgetItem()
-            item.setSizeHint(card_widget.sizeHint())
-            
-            if task[2] == "Yapılacak":
-                self.todo_list.addItem(item)
-                self.todo_list.setItemWidget(item, card_widget)
-            elif task[2] == "Yapılıyor":
-                self.doing_list.addItem(item)
-                self.doing_list.setItemWidget(item, card_widget)
-            elif task[2] == "Bitti":
-                self.done_list.addItem(item)
-                self.done_list.setItemWidget(item, card_widget)
-            elif task[2] == "Dilek Listesi":
-                self.wishlist.addItem(item)
-                self.wishlist.setItemWidget(item, card_widget)
-                
-    def update_task_category(self, task_id, new_category):
-        self.cursor.execute("""
-            UPDATE tasks 
-            SET category = ? 
-            WHERE id = ?
-        """, (new_category, task_id))
-        self.conn.commit()
-        
-    def edit_task(self, task_card):
-        # Düzenleme penceresi oluştur
-        edit_dialog = QDialog(self)
-        edit_dialog.setWindowTitle("Görevi Düzenle")
-        edit_dialog.setMinimumWidth(400)
-        edit_dialog.setStyleSheet("""
-            QDialog {
-                background-color: """ + ("#2d3748" if self.dark_theme else "white") + """;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: """ + ("white" if self.dark_theme else "#2d3748") + """;
-                font-size: 12px;
-            }
-        """)
-        
-        layout = QVBoxLayout(edit_dialog)
-        layout.setSpacing(15)
-        
-        # Başlık düzenleme
-        title_label = QLabel("📝 Görev Başlığı:")
-        title_input = QLineEdit(task_card.title)
-        title_input.setStyleSheet(self.task_input.styleSheet())
-        title_input.setFont(QFont("Segoe UI", 11))
-        
-        # Öncelik düzenleme
-        priority_label = QLabel("🎯 Öncelik:")
-        priority_combo = QComboBox()
-        priority_combo.addItems(["Düşük", "Orta", "Yüksek"])
-        priority_combo.setCurrentText(task_card.priority)
-        priority_combo.setStyleSheet(self.priority_combo.styleSheet())
-        priority_combo.setFont(QFont("Segoe UI", 11))
-        
-        # Kategori düzenleme
-        category_label = QLabel("📋 Kategori:")
-        category_combo = QComboBox()
-        category_combo.addItems(["Yapılacak", "Yapılıyor", "Bitti", "Dilek Listesi"])
-        category_combo.setCurrentText(task_card.category)
-        category_combo.setStyleSheet(self.category_combo.styleSheet())
-        category_combo.setFont(QFont("Segoe UI", 11))
-        
-        # Tarih düzenleme
-        date_label = QLabel("📅 Tarih:")
-        selected_date = QDate.fromString(task_card.due_date, "yyyy-MM-dd")
-        date_edit = QPushButton(f"📅 {selected_date.toString('dd.MM.yy')}")
-        date_edit.setStyleSheet(self.date_button.styleSheet())
-        date_edit.setFont(QFont("Segoe UI", 11))
-        date_edit.setCursor(Qt.PointingHandCursor)
-        
-        def show_calendar():
-            calendar = QCalendarWidget(edit_dialog)
-            calendar.setMinimumDate(QDate.currentDate())
-            calendar.setSelectedDate(selected_date)
-            calendar.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
-            calendar.setFixedWidth(400)
+    def start_task_index(self):
+        # Kurulum sürüyorsa yeniden başlatılmaz; sürmekte olan tur imleçten devam eder
+        if not self.task_index_building:
+            self.task_index_building = True
+            QTimer.singleShot(0, self.build_task_index)
+
+    def build_task_index(self):
+        # Trigram indeksini arayüzü kilitlemeden küçük parçalarla kur
+        rows = self.repository.title_rows(self.task_index_cursor, TASK_INDEX_SLICE)
+        for task_id, title, category in rows:
+            # Henüz yazılmamış değişiklikler indekse zaten işlendi
+            if task_id not in self.pending_tasks:
+                self.task_index.put(task_id, title, category)
+        if rows:
+            self.task_index_cursor = rows[-1][0]
+        if len(rows) == TASK_INDEX_SLICE:
+            QTimer.singleShot(0, self.build_task_index)
+        else:
+            self.task_index_building = False
             
-            # Takvim stilini ayarla
-            if self.dark_theme:
-                calendar.setStyleSheet("""
-                    QCalendarWidget {
-                        background-color: #2d3748;
-                        border: 2px solid #4a5568;
-                        border-radius: 12px;
-                    }
-                    QCalendarWidget QToolButton {
-                        color: white;
-                        background-color: transparent;
-                        padding: 8px;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                    QCalendarWidget QToolButton:hover {
-                        background-color: #4a5568;
-                    }
-                    QCalendarWidget QMenu {
-                        background-color: #2d3748;
-                        color: white;
-                        border: 1px solid #4a5568;
-                        border-radius: 4px;
-                    }
-                    QCalendarWidget QSpinBox {
-                        color: white;
-                        background-color: #2d3748;
-                        selection-background-color: #4299e1;
-                        selection-color: white;
-                        border: 1px solid #4a5568;
-                        border-radius: 4px;
-                        padding: 2px;
-                    }
-                    QCalendarWidget QTableView {
-                        background-color: #2d3748;
-                        selection-background-color: #4299e1;
-                        selection-color: white;
-                        outline: none;
-                    }
-                    QCalendarWidget QAbstractItemView:enabled {
-                        color: white;
-                        background-color: #2d3748;
-                        selection-background-color: #4299e1;
-                        selection-color: white;
-                    }
-                    QCalendarWidget QWidget#qt_calendar_navigationbar {
-                        background-color: #1a202c;
-                        border-top-left-radius: 12px;
-                        border-top-right-radius: 12px;
-                        padding: 4px;
-                    }
-                    QCalendarWidget QWidget#qt_calendar_prevmonth,
-                    QCalendarWidget QWidget#qt_calendar_nextmonth {
-                        color: white;
-                        qproperty-icon: none;
-                        min-width: 32px;
-                        max-width: 32px;
-                        min-height: 32px;
-                        max-height: 32px;
-                    }
-                    QCalendarWidget QWidget#qt_calendar_prevmonth {
-                        qproperty-text: "◀";
-                    }
-                    QCalendarWidget QWidget#qt_calendar_nextmonth {
-                        qproperty-text: "▶";
-                    }
-                    QCalendarWidget QWidget { 
-                        alternate-background-color: #2d3748;
-                    }
-                    QCalendarWidget QAbstractItemView:disabled {
-                        color: #4a5568;
-                    }
-                """)
+    def show_palette(self):
+        if self.task_palette is None:
+            self.task_palette = TaskPalette(self.task_index, self)
+        self.theme_engine.style(self.task_palette, "palette", self.theme_name())
+        self.task_palette.popup()
+        
+    def reveal_task(self, task_id):
+        # Kartı sütununda bulup seç; gerekirse aramayı kapatır ve sayfaları yükler
+        task_list = self.category_lists.get(self.task_index.category_of(task_id))
+        if task_list is None:
+            return False
+        model = task_list.task_model
+        if model.row_of(task_id) < 0 and (self.search_timer.isActive()
+                                          or not self.board_filter.is_empty()):
+            # Kart süzgeç yüzünden gizli olabilir; panoyu süzgeçsiz göster
+            self.clear_filters()
+        if model.row_of(task_id) < 0:
+            task = self.find_task(task_id) or self.repository.get_task(task_id)
+            if task is None or task.category != task_list.category:
+                return False
+            model.load_through(task)
+        row = model.row_of(task_id)
+        if row < 0:
+            return False
+        index = model.index(row)
+        task_list.setCurrentIndex(index)
+        task_list.scrollTo(index, QListView.PositionAtCenter)
+        task_list.setFocus()
+        return True
+        
+    def current_filter(self):
+        # Arama kutusu ve süzgeç çubuğundaki seçimlerden pano süzgecini oluştur
+        return TaskFilter(self.search_input.text(),
+                          [name for name, button in self.priority_filter_buttons.items()
+                           if button.isChecked()],
+                          self.filter_dates[0], self.filter_dates[1],
+                          self.overdue_button.isChecked(), self.week_button.isChecked())
+        
+    def apply_filter(self):
+        self.board_filter = self.current_filter()
+        self.search_request += 1
+        if self.board_filter.is_empty():
+            for task_list in self.category_lists.values():
+                task_list.task_model.clear_filter()
+                self.merge_pending_rows(task_list.task_model)
+            return
+        # Tamamı yüklü sütunlar bellekteki kartlarla süzülür; diğerleri arka planda
+        # indeksli sorguyla sadece eşleşen satırları okur
+        remote = {}
+        for category, task_list in self.category_lists.items():
+            tasks = task_list.task_model.loaded_matches(self.board_filter)
+            if tasks is None:
+                remote[category] = task_list.task_model.sort_mode
             else:
-                calendar.setStyleSheet("""
-                    QCalendarWidget {
-                        background-color: white;
-                        border: 2px solid #e2e8f0;
-                        border-radius: 12px;
-                    }
-                    QCalendarWidget QToolButton {
-                        color: #2d3748;
-                        background-color: transparent;
-                        padding: 8px;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                    QCalendarWidget QToolButton:hover {
-                        background-color: #edf2f7;
-                    }
-                    QCalendarWidget QMenu {
-                        background-color: white;
-                        color: #2d3748;
-                        border: 1px solid #e2e8f0;
-                        border-radius: 4px;
-                    }
-                    QCalendarWidget QSpinBox {
-                        color: #2d3748;
-                        background-color: white;
-                        selection-background-color: #4299e1;
-                        selection-color: white;
-                        border: 1px solid #e2e8f0;
-                        border-radius: 4px;
-                        padding: 2px;
-                    }
-                    QCalendarWidget QTableView {
-                        background-color: white;
-                        selection-background-color: #4299e1;
-                        selection-color: white;
-                        outline: none;
-                    }
-                    QCalendarWidget QAbstractItemView:enabled {
-                        color: #2d3748;
-                        background-color: white;
-                        selection-background-color: #4299e1;
-                        selection-color: white;
-                    }
-                    QCalendarWidget QWidget#qt_calendar_navigationbar {
-                        background-color: #f7fafc;
-                        border-top-left-radius: 12px;
-                        border-top-right-radius: 12px;
-                        padding: 4px;
-                    }
-                    QCalendarWidget QWidget#qt_calendar_prevmonth,
-                    QCalendarWidget QWidget#qt_calendar_nextmonth {
-                        color: #2d3748;
-                        qproperty-icon: none;
-                        min-width: 32px;
-                        max-width: 32px;
-                        min-height: 32px;
-                        max-height: 32px;
-                    }
-                    QCalendarWidget QWidget#qt_calendar_prevmonth {
-                        qproperty-text: "◀";
-                    }
-                    QCalendarWidget QWidget#qt_calendar_nextmonth {
-                        qproperty-text: "▶";
-                    }
-                    QCalendarWidget QWidget { 
-                        alternate-background-color: white;
-                    }
-                    QCalendarWidget QAbstractItemView:disabled {
-                        color: #cbd5e0;
-                    }
-                """)
-            
-            # Takvimi düğmenin altında göster
-            button_pos = date_edit.mapToGlobal(date_edit.rect().bottomLeft())
-            screen = QApplication.primaryScreen().geometry()
-            
-            # Takvimin ekrandan taşmasını önle
-            calendar_x = min(button_pos.x(), screen.right() - calendar.width())
-            calendar_y = min(button_pos.y(), screen.bottom() - calendar.height())
-            
-            # Eğer takvim sol kenara taşıyorsa, x koordinatını 0'a ayarla
-            calendar_x = max(calendar_x, screen.left())
-            
-            calendar.move(calendar_x, calendar_y)
+                task_list.task_model.set_filter(self.board_filter, tasks, False, None)
+        if not remote:
+            return
+        if self.search_worker is None:
+            self.search_worker = SearchWorker(self.db_path)
+            self.search_worker.found.connect(self.on_search_results)
+            self.search_worker.start()
+        self.search_worker.search(self.search_request, self.board_filter, remote)
+        
+    def on_search_results(self, request_id, columns):
+        # Sonuçlar sütunlara süzgeç olarak uygulanır; pano yeniden yüklenmez
+        if request_id != self.search_request:
+            return
+        fetch_page = partial(self.repository.filter_page, self.board_filter)
+        for category, (tasks, has_more) in columns.items():
+            model = self.category_lists[category].task_model
+            model.set_filter(self.board_filter, tasks, has_more, fetch_page)
+            self.merge_pending_rows(model)
             
-            def on_date_selected():
-                nonlocal selected_date
-                selected_date = calendar.selectedDate()
-                date_edit.setText(f"📅 {selected_date.toString('dd.MM.yy')}")
-                calendar.close()
+    def clear_filters(self):
+        # Arama kutusunu ve süzgeç çubuğunu sıfırla; pano süzgeçsiz gösterilir
+        self.search_input.clear()
+        self.search_timer.stop()
+        for button in self.filter_buttons():
+            button.setChecked(False)
+        self.filter_dates = ["", ""]
+        self.update_filter_date_buttons()
+        self.apply_filter()
+        
+    def filter_buttons(self):
+        return list(self.priority_filter_buttons.values()) + [
+            self.overdue_button, self.week_button] + self.filter_date_buttons
+        
+    def choose_filter_date(self, bound):
+        # Tarih aralığının bir ucunu takvimden seç; geçmiş tarihler de seçilebilir
+        button = self.filter_date_buttons[bound]
+        # Tıklama düğmenin işaretini değiştirdi; işaret sadece seçili tarihi gösterir
+        button.setChecked(bool(self.filter_dates[bound]))
+        selected = (QDate.fromString(self.filter_dates[bound], "yyyy-MM-dd")
+                    if self.filter_dates[bound] else QDate.currentDate())
+        self.open_calendar(button, selected, partial(self.set_filter_date, bound), past=True)
+        
+    def set_filter_date(self, bound, date):
+        self.filter_dates[bound] = date.toString("yyyy-MM-dd")
+        self.update_filter_date_buttons()
+        self.apply_filter()
+        
+    def update_filter_date_buttons(self):
+        for label, value, button in zip(("Başlangıç", "Bitiş"), self.filter_dates,
+                                        self.filter_date_buttons):
+            if value:
+                button.setText(f"📅 {label} {QDate.fromString(value, 'yyyy-MM-dd').toString('dd.MM.yy')}")
+            else:
+                button.setText(f"📅 {label}")
+            button.setChecked(bool(value))
             
-            calendar.clicked.connect(on_date_selected)
-            calendar.show()
+    def fetch_task_page(self, category, after_key, limit, sort_mode):
+        return self.repository.get_page(category, after_key, limit, sort_mode)
+        
+    def resolve_pending_rows(self, category, tasks):
+        # Okunan sayfaya henüz yazılmamış değişiklikleri uygula
+        if not self.pending_tasks:
+            return tasks
+        resolved = []
+        for task in tasks:
+            task = self.pending_tasks.get(task.id, task)
+            if task is not None and task.category == category:
+                resolved.append(task)
+        return resolved
+        
+    def merge_pending_rows(self, model):
+        # Veritabanından okunan satırlarda henüz yazılmamış eklemeler ve sütuna taşınan
+        # görevler eksiktir; iyimser kayıtları modele (süzgece uyuyorsa) ekle
+        model.merge_missing([task for task in self.pending_tasks.values()
+                             if task is not None and task.category == model.category])
+        
+    def find_task(self, task_id):
+        # Yüklü görev kaydını bul
+        return self.task_store.get(task_id)
+        
+    def task_list_of(self, task_id):
+        # Görevin yüklü olduğu listeyi bul
+        return self.category_lists.get(self.task_store.category_of(task_id))
             
-        date_edit.clicked.connect(show_calendar)
-        
-        # Butonlar
-        button_layout = QHBoxLayout()
-        save_button = QPushButton("💾 Kaydet")
-        cancel_button = QPushButton("❌ İptal")
-        
-        for button in [save_button, cancel_button]:
-            button.setStyleSheet(self.add_button.styleSheet())
-            button.setFont(QFont("Segoe UI", 11))
-            button.setCursor(Qt.PointingHandCursor)
-            button_layout.addWidget(button)
-        
-        def save_changes():
-            # Veritabanında güncelle
-            self.cursor.execute("""
-                UPDATE tasks
-                SET title = ?, category = ?, priority = ?, due_date = ?
-                WHERE id = ?
-            """, (
-                title_input.text(),
-                category_combo.currentText(),
-                priority_combo.currentText(),
-                selected_date.toString("yyyy-MM-dd"),
-                task_card.task_id
-            ))
-            self.conn.commit()
-            self.load_tasks()  # Listeyi yenile
-            edit_dialog.close()
-        
-        save_button.clicked.connect(save_changes)
-        cancel_button.clicked.connect(edit_dialog.close)
+    def add_task_item(self, task):
+        # Tek bir görevi ilgili listenin modeline ekle
+        task_list = self.category_lists.get(task.category)
+        if task_list is None:
+            return
+        task_list.task_model.insert_task(task)
         
-        # Widget'ları düzene ekle
-        for widget in [
-            title_label, title_input,
-            priority_label, priority_combo,
-            category_label, category_combo,
-            date_label, date_edit
-        ]:
-            layout.addWidget(widget)
+    def add_task_items(self, tasks):
+        # Görevleri sütunlarına toplu ekle; her model tek güncelleme alır
+        by_category = {}
+        for task in tasks:
+            by_category.setdefault(task.category, []).append(task)
+        for category, category_tasks in by_category.items():
+            task_list = self.category_lists.get(category)
+            if task_list is not None:
+                task_list.task_model.insert_tasks(category_tasks)
+        
+    def remove_task_items(self, task_ids):
+        # Görevleri listelerinden toplu çıkar; her model tek güncelleme alır
+        by_list = {}
+        for task_id in task_ids:
+            task_list = self.task_list_of(task_id)
+            if task_list is not None:
+                by_list.setdefault(task_list, []).append(task_id)
+        for task_list, list_ids in by_list.items():
+            task_list.task_model.remove_tasks(list_ids)
+        for task_id in task_ids:
+            self.task_store.remove(task_id)
+        
+    def remove_task_item(self, task_id):
+        # Görevi listesinden ve depodan çıkar
+        task_list = self.task_list_of(task_id)
+        if task_list is None:
+            return None
+        task = task_list.task_model.remove_task(task_id)
+        self.task_store.remove(task_id)
+        return task
+        
+    def update_task_item(self, task):
+        # Düzenlenen görevi yerinde güncelle, kategori değiştiyse taşı
+        task_list = self.task_list_of(task.id)
+        if task_list is not None and task_list.category != task.category:
+            self.remove_task_item(task.id)
+            task_list = None
+        if task_list is None:
+            self.add_task_item(task)
+            return
+        task_list.task_model.update_task(task)
+                
+    def next_position(self, category):
+        # Sütunun sonuna bir sıra değeri ayır
+        position = rank_after(self.tail_positions.get(category))
+        self.note_position(category, position)
+        return position
+        
+    def note_position(self, category, position):
+        tail = self.tail_positions.get(category)
+        if tail is None or position > tail:
+            self.tail_positions[category] = position
+        if len(position) > RANK_MAX_LENGTH:
+            self.rebalance_needed.add(category)
+        
+    def position_before(self, model, row, task_id):
+        # `row` satırının önüne girecek sıra değeri; taşınan görevin kendisi komşu sayılmaz
+        while row >= model.rowCount() and model.canFetchMore():
+            model.fetchMore()
+        row = min(row, model.rowCount())
+        below = row
+        if below < model.rowCount() and model.task_at(below).id == task_id:
+            below += 1
+        if below >= model.rowCount():
+            return self.next_position(model.category)
+        above = row - 1
+        if above >= 0 and model.task_at(above).id == task_id:
+            above -= 1
+        lower = model.task_at(above).position if above >= 0 else None
+        upper = model.task_at(below).position
+        if lower is not None and lower >= upper:
+            # Eşit sıra değerlerinin arasına girilemez; sütun yeniden dağıtılmalı
+            self.rebalance_needed.add(model.category)
+            return None
+        return rank_between(lower, upper)
+        
+    def update_task_category(self, task_id, new_category, position=None):
+        # Görevi yeni sütuna (varsayılan olarak sonuna) taşıyan tek satırlık yazmayı gönder;
+        # taşınan kaydı döndürür
+        if position is None:
+            position = self.next_position(new_category)
+        else:
+            self.note_position(new_category, position)
+        task = self.find_task(task_id)
+        moved = task.replace(category=new_category, position=position) if task else None
+        self.run_write("move_many", [(task_id, new_category, position)],
+                       pending={task_id: moved} if moved else None)
+        return moved
+        
+    def move_tasks(self, task_ids, new_category):
+        # Görevleri sıralarını koruyarak yeni sütunun sonuna taşı; tek executemany yazılır
+        tasks = [task for task in map(self.find_task, task_ids)
+                 if task is not None and task.category != new_category]
+        if not tasks:
+            return []
+        moved = [task.replace(category=new_category, position=self.next_position(new_category))
+                 for task in tasks]
+        self.run_write("move_many", [(task.id, task.category, task.position) for task in moved],
+                       pending={task.id: task for task in moved})
+        self.history.record(zip(tasks, moved))
+        self.remove_task_items([task.id for task in moved])
+        self.add_task_items(moved)
+        return moved
+        
+    def delete_tasks(self, task_ids):
+        tasks = [task for task in map(self.find_task, task_ids) if task is not None]
+        self.run_write("delete_many", list(task_ids),
+                       pending={task_id: None for task_id in task_ids})
+        self.history.record((task, None) for task in tasks)
+        self.remove_task_items(task_ids)
+        
+    def set_tasks_priority(self, task_ids, priority):
+        tasks = [task for task in map(self.find_task, task_ids)
+                 if task is not None and task.priority != priority]
+        if not tasks:
+            return []
+        updated = [task.replace(priority=priority) for task in tasks]
+        self.run_write("set_priority_many", [task.id for task in updated], priority,
+                       pending={task.id: task for task in updated})
+        self.history.record(zip(tasks, updated))
+        by_list = {}
+        for task in updated:
+            by_list.setdefault(self.task_list_of(task.id), []).append(task)
+        for task_list, tasks in by_list.items():
+            if task_list is not None:
+                task_list.task_model.update_tasks(tasks)
+        return updated
+        
+    def reorder_task(self, task_id, offset):
+        # Kartı sütun içinde `offset` satır kaydır; tek satırlık sıra güncellemesi yazılır
+        task_list = self.task_list_of(task_id)
+        if task_list is None:
+            return False
+        model = task_list.task_model
+        if model.sort_mode != "manual":
+            return False  # Sıralı sütunda kartın yeri sıralama ölçütünden gelir
+        row = model.row_of(task_id)
+        target = row + offset
+        if row < 0 or target < 0:
+            return False
+        # Aşağı kaydırırken yeni komşular henüz yüklenmemiş olabilir
+        while target >= model.rowCount() and model.canFetchMore():
+            model.fetchMore()
+        if target >= model.rowCount():
+            return False
+        return self.place_task(task_id, task_list, target if offset < 0 else target + 1)
+        
+    def drop_task(self, task_id, category, row):
+        # Sürüklenen kartı hedef sütunda `row` satırının önüne bırak
+        task = self.find_task(task_id)
+        task_list = self.category_lists.get(category)
+        if task is None or task_list is None:
+            return False
+        if task.category == category and task_list.task_model.row_of(task_id) in (row - 1, row):
+            return False  # Kart kendi yerine bırakıldı
+        if task_list.task_model.sort_mode != "manual":
+            # Sıralı sütunda bırakılan yerin anlamı yok; kart elle sıranın sonuna
+            # eklenir ve sıralama ölçütüne göre yerinde görünür
+            return bool(self.move_tasks([task_id], category))
+        return self.place_task(task_id, task_list, row)
+        
+    def place_task(self, task_id, task_list, row):
+        # Tek satırlık taşıma yazması; sadece etkilenen kart(lar) yerinde güncellenir
+        model = task_list.task_model
+        position = self.position_before(model, row, task_id)
+        if position is None:
+            return False
+        task = self.find_task(task_id)
+        moved = self.update_task_category(task_id, task_list.category, position)
+        if moved is None:
+            return False
+        self.history.record([(task, moved)])
+        self.update_task_item(moved)
+        task_list.setCurrentIndex(model.index(model.row_of(task_id)))
+        return True
+        
+    def edit_task(self, task):
+        # Düzenleme penceresi bir kez oluşturulur; her açılışta sadece görevle doldurulur
+        if self.edit_dialog is None:
+            self.edit_dialog = TaskEditDialog(self)
+        self.theme_engine.style(self.edit_dialog, "edit_dialog", self.theme_name())
+        self.edit_dialog.set_task(task)
+        if self.edit_dialog.exec_() != QDialog.Accepted:
+            return
         
-        layout.addLayout(button_layout)
-        edit_dialog.exec_()
+        updated = self.edit_dialog.edited_task()
+        if updated.category != task.category:
+            updated = updated.replace(position=self.next_position(updated.category))
+        # Veritabanında güncelle
+        self.run_write("update", updated, pending={task.id: updated})
+        self.history.record([(task, updated)])
+        # Sadece düzenlenen kartı güncelle
+        self.update_task_item(updated)
+        
+    def undo(self):
+        return self.apply_changes(self.history.undo())
+        
+    def redo(self):
+        return self.apply_changes(self.history.redo())
+        
+    def apply_changes(self, changes):
+        # (şimdiki, hedef) çiftlerini uygula: her tür değişiklik tek yazma, listeler yerinde güncellenir
+        if not changes:
+            return False
+        inserted = [after for before, after in changes if before is None]
+        deleted = [before.id for before, after in changes if after is None]
+        updated = [after for before, after in changes if before is not None and after is not None]
+        if inserted:
+            self.run_write("insert_many", inserted, pending={task.id: task for task in inserted})
+        if updated:
+            self.run_write("update_many", updated, pending={task.id: task for task in updated})
+        if deleted:
+            self.run_write("delete_many", deleted, pending={task_id: None for task_id in deleted})
+        for task in inserted + updated:
+            self.note_position(task.category, task.position)
+        
+        # Sütun değiştirenler çıkarılıp eklenir, yerinde kalanlar güncellenir
+        relocated = [after for before, after in changes if before is not None
+                     and after is not None and before.category != after.category]
+        self.remove_task_items(deleted + [task.id for task in relocated])
+        self.add_task_items(inserted + relocated)
+        for before, after in changes:
+            if before is not None and after is not None and before.category == after.category:
+                self.update_task_item(after)
+        return True
 
     def minimize_to_tray(self):
         if self.first_minimize:
@@ -1519,121 +3999,28 @@ class TodoApp(QMainWindow):
             msg.exec_()
             self.first_minimize = False
         
+        self.save_snapshot()
         self.hide()  # Uygulamayı gizle
 
     def show_help(self):
+        if self.help_dialog is None:
+            self.build_help_dialog()
+        theme = self.theme_name()
+        if self.theme_engine.style(self.help_dialog, "info_dialog", theme):
+            self.help_label.setText(self.theme_engine.stylesheet(theme, "help_text"))
+        self.help_dialog.exec_()
+        
+    def build_help_dialog(self):
         help_dialog = QDialog(self)
         help_dialog.setWindowTitle("Nasıl Kullanılır?")
         help_dialog.setMinimumWidth(700)  # Genişliği artırdım
         help_dialog.setMinimumHeight(600)  # Yükseklik ekledim
-        help_dialog.setStyleSheet("""
-            QDialog {
-                background-color: """ + ("#2d3748" if self.dark_theme else "white") + """;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: """ + ("white" if self.dark_theme else "#2d3748") + """;
-                font-size: 13px;
-                padding: 5px;
-                line-height: 1.6;
-            }
-            QPushButton {
-                background-color: """ + ("#4299e1" if self.dark_theme else "#3182ce") + """;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: """ + ("#3182ce" if self.dark_theme else "#2c5282") + """;
-            }
-        """)
         
         layout = QVBoxLayout(help_dialog)
         layout.setSpacing(15)
         
-        # Yardım içeriği
-        help_text = """
-        <div style='margin: 20px;'>
-            <h2 style='color: """ + ("white" if self.dark_theme else "#1a202c") + """; font-size: 24px; margin-bottom: 20px;'>
-                🎯 Ta-Du Kullanım Kılavuzu
-            </h2>
-            
-            <h3 style='color: """ + ("white" if self.dark_theme else "#2d3748") + """; font-size: 18px; margin-top: 25px;'>
-                📝 Görev Ekleme ve Düzenleme
-            </h3>
-            <p style='margin-left: 20px; line-height: 1.8;'>
-                • Üst kısımdaki görev giriş alanına görev başlığını yazın<br>
-                • Öncelik seçin: Düşük 🟢, Orta 🟡, Yüksek 🔴<br>
-                • Kategori seçin: Yapılacak, Yapılıyor, Bitti, Dilek Listesi<br>
-                • Tarih seçin: Görevin tamamlanması gereken tarihi belirleyin<br>
-                • "➕ Ekle" butonuna tıklayın veya Enter tuşuna basın
-            </p>
-            
-            <h3 style='color: """ + ("white" if self.dark_theme else "#2d3748") + """; font-size: 18px; margin-top: 25px;'>
-                ⌨️ Klavye Kısayolları
-            </h3>
-            <p style='margin-left: 20px; line-height: 1.8;'>
-                • <b>E tuşu:</b> Seçili görevi düzenleme penceresini açar<br>
-                • <b>Delete tuşu:</b> Seçili görevi silmek için onay penceresi açar<br>
-                • <b>Shift + Sağ Ok:</b> Görevi bir sonraki kategoriye taşır<br>
-                &nbsp;&nbsp;&nbsp;(Yapılacak → Yapılıyor → Bitti → Dilek Listesi)<br>
-                • <b>Shift + Sol Ok:</b> Görevi bir önceki kategoriye taşır<br>
-                &nbsp;&nbsp;&nbsp;(Dilek Listesi → Bitti → Yapılıyor → Yapılacak)<br>
-                • <b>Alt + Tab:</b> Uygulamayı simge durumuna küçültür
-            </p>
-            
-            <h3 style='color: """ + ("white" if self.dark_theme else "#2d3748") + """; font-size: 18px; margin-top: 25px;'>
-                🖱️ Fare İşlemleri
-            </h3>
-            <p style='margin-left: 20px; line-height: 1.8;'>
-                • <b>Sağ Tık Menüsü:</b><br>
-                &nbsp;&nbsp;&nbsp;✏️ Düzenle: Görevi düzenleme penceresini açar<br>
-                &nbsp;&nbsp;&nbsp;🗑️ Sil: Görevi silmek için onay penceresi açar<br>
-                &nbsp;&nbsp;&nbsp;📦 Taşı: Görevi başka bir kategoriye taşır<br>
-                • <b>Sürükle-Bırak:</b> Görevleri kategoriler arasında taşıyabilirsiniz<br>
-                • <b>Sistem Tray İkonu:</b><br>
-                &nbsp;&nbsp;&nbsp;➜ Çift tıklama: Uygulamayı tam ekran açar<br>
-                &nbsp;&nbsp;&nbsp;➜ Sağ tık: Göster ve Çıkış seçeneklerini gösterir
-            </p>
-            
-            <h3 style='color: """ + ("white" if self.dark_theme else "#2d3748") + """; font-size: 18px; margin-top: 25px;'>
-                📋 Kategoriler
-            </h3>
-            <p style='margin-left: 20px; line-height: 1.8;'>
-                • <b>📋 Yapılacak:</b> Henüz başlanmamış görevler<br>
-                • <b>🔄 Yapılıyor:</b> Üzerinde çalışılan görevler<br>
-                • <b>✅ Bitti:</b> Tamamlanan görevler<br>
-                • <b>⭐ Dilek Listesi:</b> İleride yapılması planlanan görevler
-            </p>
-            
-            <h3 style='color: """ + ("white" if self.dark_theme else "#2d3748") + """; font-size: 18px; margin-top: 25px;'>
-                🎨 Özelleştirme ve Görünüm
-            </h3>
-            <p style='margin-left: 20px; line-height: 1.8;'>
-                • <b>Tema Değiştirme:</b><br>
-                &nbsp;&nbsp;&nbsp;➜ 🎨 Tema Değiştir butonu ile açık/koyu tema arasında geçiş yapın<br>
-                • <b>Öncelik Renkleri:</b><br>
-                &nbsp;&nbsp;&nbsp;➜ Yüksek: 🔴 Kırmızı tonları<br>
-                &nbsp;&nbsp;&nbsp;➜ Orta: 🟡 Turuncu tonları<br>
-                &nbsp;&nbsp;&nbsp;➜ Düşük: 🟢 Yeşil tonları
-            </p>
-            
-            <h3 style='color: """ + ("white" if self.dark_theme else "#2d3748") + """; font-size: 18px; margin-top: 25px;'>
-                💡 İpuçları
-            </h3>
-            <p style='margin-left: 20px; line-height: 1.8;'>
-                • Kapatma (✖) butonuna tıkladığınızda uygulama sistem tepsisine küçülür<br>
-                • Görevlerinizi önceliklerine göre renklendirerek önem derecesini belirleyin<br>
-                • Tarihi geçmiş görevler için tarih kısmı kırmızı ile vurgulanır<br>
-                • Görevleri sürükleyerek kategoriler arasında hızlıca taşıyabilirsiniz<br>
-                • Sistem tepsisindeki simgeye çift tıklayarak uygulamayı tekrar açabilirsiniz
-            </p>
-        </div>
-        """
-        
-        help_label = QLabel(help_text)
+        # Yardım içeriği temaya göre show_help'te doldurulur
+        help_label = QLabel()
         help_label.setWordWrap(True)
         help_label.setTextFormat(Qt.RichText)
         
@@ -1641,26 +4028,6 @@ class TodoApp(QMainWindow):
         scroll = QScrollArea()
         scroll.setWidget(help_label)
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: """ + ("#4a5568" if self.dark_theme else "#e2e8f0") + """;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: """ + ("#718096" if self.dark_theme else "#cbd5e0") + """;
-                border-radius: 6px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        """)
         
         layout.addWidget(scroll)
         
@@ -1670,41 +4037,19 @@ class TodoApp(QMainWindow):
         close_button.setCursor(Qt.PointingHandCursor)
         layout.addWidget(close_button)
         
-        help_dialog.exec_()
+        self.help_dialog = help_dialog
+        self.help_label = help_label
 
     def show_developer(self):
+        if self.developer_dialog is None:
+            self.build_developer_dialog()
+        self.theme_engine.style(self.developer_dialog, "info_dialog", self.theme_name())
+        self.developer_dialog.exec_()
+        
+    def build_developer_dialog(self):
         dev_dialog = QDialog(self)
         dev_dialog.setWindowTitle("Geliştirici Hakkında")
         dev_dialog.setMinimumWidth(500)
-        dev_dialog.setStyleSheet("""
-            QDialog {
-                background-color: """ + ("#2d3748" if self.dark_theme else "white") + """;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: """ + ("white" if self.dark_theme else "#2d3748") + """;
-                font-size: 13px;
-                padding: 5px;
-                line-height: 1.6;
-            }
-            QPushButton {
-                background-color: """ + ("#4299e1" if self.dark_theme else "#3182ce") + """;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: """ + ("#3182ce" if self.dark_theme else "#2c5282") + """;
-            }
-            QWidget#linkWidget {
-                background-color: """ + ("#4a5568" if self.dark_theme else "#edf2f7") + """;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 10px;
-            }
-        """)
         
         layout = QVBoxLayout(dev_dialog)
         layout.setSpacing(20)
@@ -1789,12 +4134,18 @@ class TodoApp(QMainWindow):
         close_button.setCursor(Qt.PointingHandCursor)
         layout.addWidget(close_button)
         
-        dev_dialog.exec_()
+        self.developer_dialog = dev_dialog
 
 if __name__ == '__main__':
+    profile_startup = '--profile-startup' in sys.argv
+    if profile_startup:
+        sys.argv.remove('--profile-startup')
+    profiler = StartupProfiler(profile_startup, STARTUP_STARTED)
+    profiler.mark("Modüller")
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
-    init_sounds()  # Sesleri başlangıçta yükle
-    window = TodoApp()
+    profiler.mark("QApplication")
+    # Sesler ve tepsi ikonu pencere gösterildikten sonra yüklenir
+    window = TodoApp(profiler)
     window.show()
     sys.exit(app.exec_()) 
\ No newline at end of file